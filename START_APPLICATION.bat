@@ -13,4 +13,5 @@ echo.
 echo Press Ctrl+C to stop the server
 echo ═══════════════════════════════════════════════════════════════
 echo.
+set LOCAL_NEXUS_BOOTSTRAP=1
 python -m local_nexus_controller
@@ -1,48 +1,13 @@
 import os
-import sys
-import subprocess
 import threading
 import webbrowser
 
-try:
-    import uvicorn
-except ImportError:
-    print("=" * 60)
-    print("MISSING DEPENDENCIES")
-    print("=" * 60)
-    print("uvicorn is not installed. Installing dependencies...")
-    print()
+if (os.getenv("LOCAL_NEXUS_BOOTSTRAP", "") or "").lower() in {"1", "true", "yes", "on"}:
+    from local_nexus_controller.bootstrap import ensure_dependencies
 
-    installation_methods = [
-        (["pip3", "install", "-r", "requirements.txt"], "pip3 install"),
-        (["pip", "install", "-r", "requirements.txt"], "pip install"),
-        ([sys.executable, "-m", "pip", "install", "-r", "requirements.txt"], "python -m pip"),
-        (["pip3", "install", "--user", "-r", "requirements.txt"], "pip3 install --user"),
-        (["pip", "install", "--user", "-r", "requirements.txt"], "pip install --user"),
-    ]
+    ensure_dependencies()
 
-    success = False
-    for cmd, desc in installation_methods:
-        try:
-            print(f"Trying: {desc}...")
-            subprocess.check_call(cmd, stderr=subprocess.STDOUT)
-            print(f"\n✓ Dependencies installed successfully using {desc}")
-            print("Please restart the application.\n")
-            success = True
-            break
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            continue
-
-    if not success:
-        print("\n✗ Failed to install dependencies using all methods")
-        print("\nPlease install manually using one of these commands:")
-        print("  pip install -r requirements.txt")
-        print("  pip3 install -r requirements.txt")
-        print(f"  {sys.executable} -m pip install -r requirements.txt")
-        print()
-        sys.exit(1)
-
-    sys.exit(0)
+import uvicorn
 
 from local_nexus_controller.settings import settings
 
@@ -62,15 +27,23 @@ def main() -> None:
 
         threading.Timer(0.75, _open).start()
 
-    reload_dirs = [str(settings.project_root / "local_nexus_controller")]
+    run_kwargs: dict = {}
+    if settings.reload:
+        # uvicorn[standard] ships watchfiles, so reload uses OS file events rather than polling.
+        run_kwargs = {
+            "reload": True,
+            "reload_dirs": [str(settings.project_root / "local_nexus_controller")],
+            "reload_includes": ["*.py", "*.html", "*.css", "*.js"],
+            "reload_delay": 0.25,
+        }
+    elif settings.workers > 1:
+        run_kwargs = {"workers": settings.workers}
 
     uvicorn.run(
         "local_nexus_controller.main:app",
         host=settings.host,
         port=settings.port,
-        reload=settings.reload,
-        reload_dirs=reload_dirs if settings.reload else None,
-        reload_includes=["*.py", "*.html", "*.css", "*.js"] if settings.reload else None,
+        **run_kwargs,
     )
 
 
@@ -0,0 +1,61 @@
+"""
+Optional first-run dependency installer.
+
+`python -m local_nexus_controller` imports uvicorn directly and fails fast if
+dependencies are missing. For local convenience, set LOCAL_NEXUS_BOOTSTRAP=1
+(or run `python -m local_nexus_controller.bootstrap`) to install
+requirements.txt on a miss before starting.
+"""
+from __future__ import annotations
+
+import subprocess
+import sys
+
+
+def ensure_dependencies() -> None:
+    """Install requirements.txt if uvicorn cannot be imported, then exit so the user restarts."""
+    try:
+        import uvicorn  # noqa: F401
+        return
+    except ImportError:
+        pass
+
+    print("=" * 60)
+    print("MISSING DEPENDENCIES")
+    print("=" * 60)
+    print("uvicorn is not installed. Installing dependencies...")
+    print()
+
+    installation_methods = [
+        (["pip3", "install", "-r", "requirements.txt"], "pip3 install"),
+        (["pip", "install", "-r", "requirements.txt"], "pip install"),
+        ([sys.executable, "-m", "pip", "install", "-r", "requirements.txt"], "python -m pip"),
+        (["pip3", "install", "--user", "-r", "requirements.txt"], "pip3 install --user"),
+        (["pip", "install", "--user", "-r", "requirements.txt"], "pip install --user"),
+    ]
+
+    for cmd, desc in installation_methods:
+        try:
+            print(f"Trying: {desc}...")
+            subprocess.check_call(cmd, stderr=subprocess.STDOUT)
+            print(f"\n✓ Dependencies installed successfully using {desc}")
+            print("Please restart the application.\n")
+            sys.exit(0)
+        except (subprocess.CalledProcessError, FileNotFoundError):
+            continue
+
+    print("\n✗ Failed to install dependencies using all methods")
+    print("\nPlease install manually using one of these commands:")
+    print("  pip install -r requirements.txt")
+    print("  pip3 install -r requirements.txt")
+    print(f"  {sys.executable} -m pip install -r requirements.txt")
+    print()
+    sys.exit(1)
+
+
+if __name__ == "__main__":
+    ensure_dependencies()
+
+    from local_nexus_controller.__main__ import main
+
+    main()
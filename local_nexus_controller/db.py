@@ -18,6 +18,10 @@ _ensure_parent_dir(settings.db_path)
 engine = create_engine(
     f"sqlite:///{settings.db_path.as_posix()}",
     connect_args={"check_same_thread": False},
+    # Routers and background threads share this engine; LIFO keeps the most
+    # recently used connection (and its statement cache) warm.
+    pool_use_lifo=True,
+    pool_pre_ping=True,
 )
 
 
@@ -36,6 +40,9 @@ def _sqlite_migrate() -> None:
         cols = [row[1] for row in conn.execute(text("PRAGMA table_info(service)")).fetchall()]
         if cols and "env_overrides" not in cols:
             conn.execute(text("ALTER TABLE service ADD COLUMN env_overrides TEXT"))
+        if cols:
+            # create_all() does not add new indexes to tables that already exist.
+            conn.execute(text("CREATE INDEX IF NOT EXISTS ix_service_db_name ON service (database_id, name)"))
 
 
 def get_session() -> Generator[Session, None, None]:
@@ -1,8 +1,16 @@
 from __future__ import annotations
 
+import asyncio
+import atexit
+import logging
+import queue
+import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 
 from sqlmodel import Session, select
@@ -22,54 +30,82 @@ from local_nexus_controller.services.auto_discovery import scan_repository_folde
 from local_nexus_controller.services.file_watcher import start_file_watcher
 from local_nexus_controller.services.process_manager import start_service
 from local_nexus_controller.services.registry_import import import_bundle
+from local_nexus_controller.services.service_index import existing_ports_and_names
 from local_nexus_controller.settings import settings
 
 
-app = FastAPI(title="Local Nexus Controller", version="0.1.0")
+def _configure_logging() -> logging.Logger:
+    """
+    Startup messages go through a queue; a listener thread does the stdout
+    writes so boot tasks never block on a slow or non-tty stdout.
+    """
+    logger = logging.getLogger("local_nexus_controller")
+    if not logger.handlers:
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        stream = logging.StreamHandler(sys.stdout)
+        stream.setFormatter(logging.Formatter("%(message)s"))
+        listener = QueueListener(log_queue, stream)
+        listener.start()
+        atexit.register(listener.stop)
+        logger.addHandler(QueueHandler(log_queue))
+        logger.setLevel(logging.INFO)
+        logger.propagate = False
+    return logger
+
+
+log = _configure_logging()
+
+app = FastAPI(title="Local Nexus Controller", version="0.1.0", default_response_class=ORJSONResponse)
 
 static_dir = Path(__file__).resolve().parent / "static"
 app.mount("/static", StaticFiles(directory=str(static_dir)), name="static")
 
-app.include_router(ui_router)
-app.include_router(api_health_router, prefix="/api", tags=["health"])
-app.include_router(api_services_router, prefix="/api/services", tags=["services"])
-app.include_router(api_databases_router, prefix="/api/databases", tags=["databases"])
-app.include_router(api_ports_router, prefix="/api/ports", tags=["ports"])
-app.include_router(api_keys_router, prefix="/api/keys", tags=["keys"])
-app.include_router(api_import_router, prefix="/api/import", tags=["import"])
-app.include_router(api_summary_router, prefix="/api/summary", tags=["summary"])
-app.include_router(api_autodiscovery_router, prefix="/api/autodiscovery", tags=["autodiscovery"])
+# (router, prefix, tag); the UI router is mounted at the root without a tag.
+ROUTERS = (
+    (ui_router, "", None),
+    (api_health_router, "/api", "health"),
+    (api_services_router, "/api/services", "services"),
+    (api_databases_router, "/api/databases", "databases"),
+    (api_ports_router, "/api/ports", "ports"),
+    (api_keys_router, "/api/keys", "keys"),
+    (api_import_router, "/api/import", "import"),
+    (api_summary_router, "/api/summary", "summary"),
+    (api_autodiscovery_router, "/api/autodiscovery", "autodiscovery"),
+)
 
+for _router, _prefix, _tag in ROUTERS:
+    app.include_router(_router, prefix=_prefix, tags=[_tag] if _tag else None)
 
-@app.on_event("startup")
-def _startup() -> None:
-    """Initialize application on startup."""
+
+_SELECT_STARTABLE_SERVICE_IDS = select(Service.id).where(Service.start_command != "", Service.status != "running")
+
+# Strong references to in-flight startup tasks (asyncio only keeps weak ones).
+_background_tasks: set[asyncio.Task] = set()
+
+
+def _run_auto_discovery() -> None:
+    if not (settings.auto_discovery_enabled and settings.repositories_folder):
+        return
     try:
-        init_db()
+        if settings.repositories_folder.exists():
+            with Session(engine) as session:
+                existing_ports, existing_names = existing_ports_and_names(session)
+
+                bundles = scan_repository_folder(str(settings.repositories_folder), existing_ports)
+
+                for bundle in bundles:
+                    if bundle.service.name not in existing_names:
+                        try:
+                            import_bundle(session, bundle)
+                        except Exception:
+                            pass
+
+                session.commit()
     except Exception:
         pass
 
-    if settings.auto_discovery_enabled and settings.repositories_folder:
-        try:
-            if settings.repositories_folder.exists():
-                with Session(engine) as session:
-                    existing_services = list(session.exec(select(Service)))
-                    existing_ports = {s.port for s in existing_services if s.port is not None}
-                    existing_names = {s.name for s in existing_services}
-
-                    bundles = scan_repository_folder(str(settings.repositories_folder), existing_ports)
-
-                    for bundle in bundles:
-                        if bundle.service.name not in existing_names:
-                            try:
-                                import_bundle(session, bundle)
-                            except Exception:
-                                pass
-
-                    session.commit()
-        except Exception:
-            pass
 
+def _start_file_watcher() -> None:
     if settings.file_watcher_enabled and settings.file_watcher_folder and settings.repositories_folder:
         try:
             if settings.file_watcher_folder.exists() and settings.repositories_folder.exists():
@@ -80,28 +116,81 @@ def _startup() -> None:
         except Exception:
             pass
 
-    if settings.auto_start_all_on_boot:
+
+def _start_one(service_id: str) -> tuple[str, bool, str | None]:
+    # Sessions are not thread-safe, so each worker gets its own.
+    with Session(engine) as session:
+        svc = session.get(Service, service_id)
+        if svc is None:
+            return service_id, False, "service no longer exists"
+        name = svc.name
         try:
-            with Session(engine) as session:
-                services = list(session.exec(select(Service)))
-                startable_services = [s for s in services if s.start_command and s.status != "running"]
-
-                if startable_services:
-                    print(f"\n{'=' * 60}")
-                    print(f"Auto-starting {len(startable_services)} service(s)")
-                    print(f"{'=' * 60}")
-                    for svc in startable_services:
-                        try:
-                            print(f"  Starting: {svc.name}...", end=" ", flush=True)
-                            start_service(session, svc)
-                            print("✓ Started")
-                        except Exception as e:
-                            print(f"✗ Error: {e}")
-                    session.commit()
-                    print(f"{'=' * 60}")
-                    print(f"Auto-start complete")
-                    print(f"{'=' * 60}\n")
-                else:
-                    print("\nNo services to auto-start (all services already running or no start commands defined)\n")
+            svc = start_service(session, svc)
+            result = (svc.name, True, None) if svc.status == "running" else (svc.name, False, svc.last_error)
+        except Exception as e:
+            result = (name, False, str(e))
+        # start_service's error paths set status/last_error without committing;
+        # persist them so the dashboard shows why the auto-start failed.
+        try:
+            session.commit()
         except Exception as e:
-            print(f"Auto-start error: {e}")
+            session.rollback()
+            log.warning("Could not save auto-start status for %s: %s", result[0], e)
+        return result
+
+
+def _run_auto_start() -> None:
+    if not settings.auto_start_all_on_boot:
+        return
+    try:
+        with Session(engine) as session:
+            startable_ids = list(session.exec(_SELECT_STARTABLE_SERVICE_IDS))
+
+        if not startable_ids:
+            log.info("No services to auto-start (all services already running or no start commands defined)")
+            return
+
+        log.info("=" * 60)
+        log.info("Auto-starting %d service(s)", len(startable_ids))
+        log.info("=" * 60)
+        # Bounded pool: overlap process spawns without a fork storm.
+        with ThreadPoolExecutor(max_workers=min(32, len(startable_ids))) as executor:
+            futures = [executor.submit(_start_one, service_id) for service_id in startable_ids]
+            for future in as_completed(futures):
+                name, ok, err = future.result()
+                if ok:
+                    log.info("  Started: %s ✓", name)
+                else:
+                    log.info("  Failed:  %s ✗ %s", name, err)
+        log.info("=" * 60)
+        log.info("Auto-start complete")
+        log.info("=" * 60)
+    except Exception as e:
+        log.error("Auto-start error: %s", e)
+
+
+def _run_boot_tasks() -> None:
+    # Sequential on purpose: auto-start should see services that auto-discovery just imported.
+    _run_auto_discovery()
+    _run_auto_start()
+
+
+@app.on_event("startup")
+async def _startup() -> None:
+    """
+    Initialize application on startup.
+
+    Only init_db() runs inline; repo scanning and auto-start happen on a worker
+    thread so the server starts accepting requests immediately.
+    """
+    try:
+        init_db()
+    except Exception:
+        pass
+
+    # FileWatcher already runs its loop on its own daemon thread.
+    _start_file_watcher()
+
+    task = asyncio.create_task(asyncio.to_thread(_run_boot_tasks))
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
@@ -1,8 +1,10 @@
+import os
+import time
 import uuid
 from datetime import datetime, timezone
 from typing import Any, Optional
 
-from sqlalchemy import Column
+from sqlalchemy import Column, Index
 from sqlalchemy.types import JSON
 from sqlmodel import Field, Relationship, SQLModel
 
@@ -12,10 +14,24 @@ def _now_utc() -> datetime:
 
 
 def _uuid_str() -> str:
-    return str(uuid.uuid4())
+    """
+    Time-ordered UUIDv7 (RFC 9562) as a string: 48-bit Unix ms timestamp,
+    then random bits. New rows append to the end of the primary-key index
+    instead of landing at random pages like uuid4.
+    """
+    ms = time.time_ns() // 1_000_000
+    rand = int.from_bytes(os.urandom(10), "big")
+    value = (ms & 0xFFFF_FFFF_FFFF) << 80 | rand
+    value = (value & ~(0xF << 76)) | (0x7 << 76)  # version 7
+    value = (value & ~(0x3 << 62)) | (0x2 << 62)  # RFC 4122 variant
+    return str(uuid.UUID(int=value))
 
 
 class Service(SQLModel, table=True):
+    # Linked-services lookups join and filter on database_id. get_database sorts
+    # the loaded services by name in Python, so SQL only uses the leading column.
+    __table_args__ = (Index("ix_service_db_name", "database_id", "name"),)
+
     id: str = Field(default_factory=_uuid_str, primary_key=True, index=True)
 
     name: str = Field(index=True)
@@ -3,19 +3,23 @@ API routes for auto-discovery of programs in repository folders.
 """
 from __future__ import annotations
 
+import asyncio
 from pathlib import Path
 
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
-from sqlmodel import Session, select
+from sqlmodel import Session
 
 from local_nexus_controller.db import get_session
-from local_nexus_controller.models import ImportBundle, Service
+from local_nexus_controller.models import ImportBundle
 from local_nexus_controller.services.auto_discovery import (
     extract_and_scan_zip,
+    iter_repository_folder,
     scan_repository_folder,
 )
 from local_nexus_controller.services.registry_import import import_bundle
+from local_nexus_controller.services.service_index import existing_ports_and_names
 
 
 router = APIRouter()
@@ -32,28 +36,26 @@ class ScanResponse(BaseModel):
     bundles: list[ImportBundle]
 
 
-@router.post("/scan", response_model=ScanResponse)
-def scan_folder(request: ScanRequest, session: Session = Depends(get_session)) -> ScanResponse:
-    """
-    Scan a folder for programs and optionally auto-import them.
-    """
-    folder_path = Path(request.folder_path)
+def _scan_folder_path(folder: str) -> Path:
+    folder_path = Path(folder)
 
     if not folder_path.exists():
-        raise HTTPException(status_code=404, detail=f"Folder not found: {request.folder_path}")
+        raise HTTPException(status_code=404, detail=f"Folder not found: {folder}")
 
     if not folder_path.is_dir():
-        raise HTTPException(status_code=400, detail=f"Path is not a directory: {request.folder_path}")
+        raise HTTPException(status_code=400, detail=f"Path is not a directory: {folder}")
+
+    return folder_path
+
 
-    # Get existing ports
-    existing_services = list(session.exec(select(Service)))
-    existing_ports = {s.port for s in existing_services if s.port is not None}
+def _scan_and_import(session: Session, folder_path: Path, auto_import: bool) -> tuple[list[ImportBundle], int]:
+    existing_ports, _ = existing_ports_and_names(session)
 
     # Scan for programs
     bundles = scan_repository_folder(str(folder_path), existing_ports)
 
     imported = 0
-    if request.auto_import:
+    if auto_import:
         for bundle in bundles:
             try:
                 import_bundle(session, bundle)
@@ -63,6 +65,19 @@ def scan_folder(request: ScanRequest, session: Session = Depends(get_session)) -
 
         session.commit()
 
+    return bundles, imported
+
+
+@router.post("/scan", response_model=ScanResponse)
+async def scan_folder(request: ScanRequest, session: Session = Depends(get_session)) -> ScanResponse:
+    """
+    Scan a folder for programs and optionally auto-import them.
+    """
+    folder_path = _scan_folder_path(request.folder_path)
+
+    # Walking large trees can take a while; keep it off the request threadpool.
+    bundles, imported = await asyncio.to_thread(_scan_and_import, session, folder_path, request.auto_import)
+
     return ScanResponse(
         discovered=len(bundles),
         imported=imported,
@@ -70,6 +85,23 @@ def scan_folder(request: ScanRequest, session: Session = Depends(get_session)) -
     )
 
 
+@router.post("/scan-stream")
+def scan_folder_stream(request: ScanRequest, session: Session = Depends(get_session)) -> StreamingResponse:
+    """
+    Scan a folder and stream the discovered bundles as NDJSON, one ImportBundle
+    per line, as each repository is inspected. Read-only: auto_import is ignored,
+    use /scan for that.
+    """
+    folder_path = _scan_folder_path(request.folder_path)
+    existing_ports, _ = existing_ports_and_names(session)
+
+    def _gen():
+        for bundle in iter_repository_folder(str(folder_path), existing_ports):
+            yield bundle.model_dump_json() + "\n"
+
+    return StreamingResponse(_gen(), media_type="application/x-ndjson")
+
+
 class ExtractZipRequest(BaseModel):
     zip_path: str
     extract_to: str
@@ -82,8 +114,13 @@ class ExtractZipResponse(BaseModel):
     bundle: ImportBundle | None = None
 
 
+def _import_and_commit(session: Session, bundle: ImportBundle) -> None:
+    import_bundle(session, bundle)
+    session.commit()
+
+
 @router.post("/extract-zip", response_model=ExtractZipResponse)
-def extract_zip(request: ExtractZipRequest, session: Session = Depends(get_session)) -> ExtractZipResponse:
+async def extract_zip(request: ExtractZipRequest, session: Session = Depends(get_session)) -> ExtractZipResponse:
     """
     Extract a ZIP file and auto-discover the program inside.
     """
@@ -96,7 +133,8 @@ def extract_zip(request: ExtractZipRequest, session: Session = Depends(get_sessi
     if not extract_to.exists():
         extract_to.mkdir(parents=True, exist_ok=True)
 
-    bundle = extract_and_scan_zip(zip_path, extract_to)
+    # Extraction of a large archive can take seconds; run it on its own thread.
+    bundle = await asyncio.to_thread(extract_and_scan_zip, zip_path, extract_to)
 
     if not bundle:
         return ExtractZipResponse(
@@ -107,8 +145,7 @@ def extract_zip(request: ExtractZipRequest, session: Session = Depends(get_sessi
 
     if request.auto_import:
         try:
-            import_bundle(session, bundle)
-            session.commit()
+            await asyncio.to_thread(_import_and_commit, session, bundle)
             return ExtractZipResponse(
                 success=True,
                 message=f"Successfully imported {bundle.service.name}",
@@ -1,19 +1,30 @@
 from __future__ import annotations
 
+import asyncio
+
 from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.orm import joinedload
 from sqlmodel import Session, select
 
-from local_nexus_controller.db import get_session
+from local_nexus_controller.db import engine, get_session
 from local_nexus_controller.models import Database, DatabaseCreate, DatabaseUpdate, Service
 from local_nexus_controller.security import require_token
 
 
 router = APIRouter()
 
+_SELECT_DATABASES_BY_NAME = select(Database).order_by(Database.database_name)
+
+
+def _list_databases() -> list[Database]:
+    with Session(engine) as session:
+        return list(session.exec(_SELECT_DATABASES_BY_NAME))
+
 
 @router.get("")
-def list_databases(session: Session = Depends(get_session)) -> list[Database]:
-    return list(session.exec(select(Database).order_by(Database.database_name)))
+async def list_databases() -> list[Database]:
+    # Polled by the dashboard; keep it off the shared request threadpool.
+    return await asyncio.to_thread(_list_databases)
 
 
 @router.post("", dependencies=[Depends(require_token)])
@@ -27,11 +38,14 @@ def create_database(db_in: DatabaseCreate, session: Session = Depends(get_sessio
 
 @router.get("/{database_id}")
 def get_database(database_id: str, session: Session = Depends(get_session)) -> dict:
-    db = session.get(Database, database_id)
+    # Load the database and its linked services in one joined query.
+    db = session.exec(
+        select(Database).where(Database.id == database_id).options(joinedload(Database.services))
+    ).unique().first()
     if not db:
         raise HTTPException(status_code=404, detail="Database not found")
 
-    linked = list(session.exec(select(Service).where(Service.database_id == db.id).order_by(Service.name)))
+    linked = sorted(db.services, key=lambda s: s.name)
     safe = db.model_dump()  # type: ignore[attr-defined]
     safe["linked_services"] = [{"id": s.id, "name": s.name, "status": s.status, "port": s.port} for s in linked]
     return safe
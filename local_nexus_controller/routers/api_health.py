@@ -4,11 +4,13 @@ Health check and diagnostics API endpoints.
 from __future__ import annotations
 
 import sys
+import time
 from pathlib import Path
 
 from fastapi import APIRouter
 from pydantic import BaseModel
-from sqlmodel import Session, select
+from sqlalchemy import text
+from sqlmodel import Session, func, select
 
 from local_nexus_controller.db import engine
 from local_nexus_controller.models import Service
@@ -17,6 +19,23 @@ from local_nexus_controller.settings import settings
 
 router = APIRouter()
 
+_COUNT_SERVICES = select(func.count()).select_from(Service)
+_COUNT_RUNNING_SERVICES = _COUNT_SERVICES.where(Service.status == "running")
+
+# Successful DB probes are reused briefly so frequent monitoring polls don't
+# each open a connection.
+_DB_PROBE_TTL_SECONDS = 2.0
+_db_probe_ok_at = 0.0
+
+
+def _probe_database() -> None:
+    global _db_probe_ok_at
+    if time.monotonic() - _db_probe_ok_at < _DB_PROBE_TTL_SECONDS:
+        return
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1")).one()
+    _db_probe_ok_at = time.monotonic()
+
 
 class HealthStatus(BaseModel):
     status: str
@@ -38,8 +57,7 @@ def health_check() -> HealthStatus:
     # Check database connectivity
     database_ok = False
     try:
-        with Session(engine) as session:
-            session.exec(select(Service)).first()
+        _probe_database()
         database_ok = True
     except Exception as e:
         errors.append(f"Database error: {str(e)}")
@@ -48,13 +66,17 @@ def health_check() -> HealthStatus:
     if not settings.db_path.parent.exists():
         warnings.append(f"Database directory missing: {settings.db_path.parent}")
 
-    if not settings.log_dir.exists():
+    # A bare mkdir doubles as the existence check: one syscall when the
+    # directory is already there.
+    try:
+        settings.log_dir.mkdir(parents=True)
         warnings.append(f"Log directory missing: {settings.log_dir}")
-        try:
-            settings.log_dir.mkdir(parents=True, exist_ok=True)
-            warnings.append(f"Created log directory: {settings.log_dir}")
-        except Exception as e:
-            errors.append(f"Cannot create log directory: {e}")
+        warnings.append(f"Created log directory: {settings.log_dir}")
+    except FileExistsError:
+        pass
+    except Exception as e:
+        warnings.append(f"Log directory missing: {settings.log_dir}")
+        errors.append(f"Cannot create log directory: {e}")
 
     # Check auto-discovery folder
     if settings.auto_discovery_enabled and settings.repositories_folder:
@@ -113,22 +135,21 @@ def diagnostics() -> DiagnosticsInfo:
     Detailed diagnostics information.
     """
     # Get database info
-    db_exists = settings.db_path.exists()
+    db_exists = False
     db_size = None
-    if db_exists:
-        try:
-            db_size = settings.db_path.stat().st_size / (1024 * 1024)  # Convert to MB
-        except Exception:
-            pass
+    try:
+        db_size = settings.db_path.stat().st_size / (1024 * 1024)  # Convert to MB
+        db_exists = True
+    except OSError:
+        pass
 
     # Get service counts
     total_services = 0
     running_services = 0
     try:
         with Session(engine) as session:
-            services = list(session.exec(select(Service)))
-            total_services = len(services)
-            running_services = sum(1 for s in services if s.status == "running")
+            total_services = session.exec(_COUNT_SERVICES).one()
+            running_services = session.exec(_COUNT_RUNNING_SERVICES).one()
     except Exception:
         pass
 
@@ -1,29 +1,217 @@
 from __future__ import annotations
 
+import asyncio
 import base64
-import json
+import hashlib
 import os
+import random
 import re
 import subprocess
+import threading
+import time
 import urllib.error
 import urllib.parse
 import urllib.request
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from email.message import Message
+from functools import lru_cache
+from itertools import chain, groupby
 from pathlib import Path
 from typing import Any
 
+import orjson
 from fastapi import APIRouter, Depends
 from fastapi import HTTPException
+from fastapi import Response
 from sqlmodel import Session, select
 from sqlmodel import SQLModel
 
-from local_nexus_controller.db import get_session
+from local_nexus_controller.db import engine, get_session
 from local_nexus_controller.models import ImportBundle, KeyRef, Service, ServiceCreate
 from local_nexus_controller.security import require_token
+from local_nexus_controller.services import http_pool
+from local_nexus_controller.services.auto_discovery import SKIP_FOLDERS
 from local_nexus_controller.services.registry_import import import_bundle as import_bundle_impl
+from local_nexus_controller.services.service_index import invalidate_service_index
 
 
 router = APIRouter()
 
+# Shared pool for fanning out independent GitHub API calls. The HTTP helpers
+# are blocking, so concurrency comes from threads, not from the event loop.
+_GITHUB_EXECUTOR = ThreadPoolExecutor(max_workers=8, thread_name_prefix="github")
+
+
+@lru_cache(maxsize=4096)
+def _quote(value: str) -> str:
+    # Branches, refs, paths and SHAs repeat across a request's GitHub URLs.
+    # safe="/" (quote's default) is kept: contents paths and branch names like
+    # local-nexus/merge-x must keep their slashes.
+    return urllib.parse.quote(value)
+
+
+# Conditional-GET cache: (url, authorization) -> (etag, raw body, stored_at, Link header).
+# Revalidating with If-None-Match turns unchanged responses into empty 304s,
+# which GitHub does not count against the rate limit. Bodies are re-parsed on
+# every hit so callers never share (and mutate) one payload object.
+_ETAG_CACHE_MAX = 1024
+_ETAG_CACHE_MAX_BYTES = 64 * 1024 * 1024
+_etag_cache: OrderedDict[tuple[str, str], tuple[str, bytes, float, str]] = OrderedDict()
+_etag_cache_bytes = 0
+_etag_lock = threading.Lock()
+
+# Responses that may be served from the cache without revalidating, and for how
+# long. Git objects addressed by SHA never change; repo metadata (default
+# branch) rarely does. Refs and contents always revalidate, since the PR flows
+# read them right after writing them.
+_FRESH_FOR = (
+    (re.compile(r"^https://api\.github\.com/repos/[^/]+/[^/]+/git/(?:blobs|trees|commits)/[0-9a-f]{40,64}(?:\?recursive=1)?$"), float("inf")),
+    (re.compile(r"^https://api\.github\.com/repos/[^/?]+/[^/?]+$"), 300.0),
+)
+
+
+def _fresh_for(url: str) -> float:
+    for pattern, seconds in _FRESH_FOR:
+        if pattern.match(url):
+            return seconds
+    return 0.0
+
+
+def _etag_lookup(key: tuple[str, str]) -> tuple[str, bytes, float, str] | None:
+    with _etag_lock:
+        hit = _etag_cache.get(key)
+        if hit is not None:
+            _etag_cache.move_to_end(key)
+        return hit
+
+
+def _etag_store(key: tuple[str, str], etag: str | None, body: bytes, link: str) -> None:
+    global _etag_cache_bytes
+    if not etag or len(body) > _ETAG_CACHE_MAX_BYTES // 8:
+        return
+    with _etag_lock:
+        old = _etag_cache.pop(key, None)
+        if old is not None:
+            _etag_cache_bytes -= len(old[1])
+        _etag_cache[key] = (etag, body, time.monotonic(), link)
+        _etag_cache_bytes += len(body)
+        while len(_etag_cache) > _ETAG_CACHE_MAX or _etag_cache_bytes > _ETAG_CACHE_MAX_BYTES:
+            _, (_, evicted, _, _) = _etag_cache.popitem(last=False)
+            _etag_cache_bytes -= len(evicted)
+
+
+def _conditional_get(url: str, headers: dict[str, str], timeout: int) -> tuple[bytes, str]:
+    """
+    GET url and return (raw body, Link header), revalidating against the ETag
+    cache (or skipping the request entirely while a _FRESH_FOR entry is fresh).
+    HTTPError other than 304 propagates to the caller.
+    """
+    key = (url, headers.get("Authorization", ""))
+    cached = _etag_lookup(key)
+    if cached is not None:
+        if time.monotonic() - cached[2] < _fresh_for(url):
+            return cached[1], cached[3]
+        headers = {**headers, "If-None-Match": cached[0]}
+    req = urllib.request.Request(url, headers=headers, method="GET")
+    try:
+        with _github_urlopen(req, timeout=timeout) as resp:
+            body = resp.read()
+            link = resp.headers.get("Link") or ""
+            _etag_store(key, resp.headers.get("ETag"), body, link)
+            return body, link
+    except urllib.error.HTTPError as e:
+        if e.code == 304 and cached is not None:
+            return cached[1], cached[3]
+        raise
+
+
+# GitHub rate limits. Once a token's X-RateLimit-Remaining hits 0, further
+# calls wait for X-RateLimit-Reset (or fail fast if that is too far away), and
+# 403/429 rate-limit responses are retried after Retry-After / the reset time.
+_RATE_LIMIT_MAX_WAIT = 60.0
+_RATE_LIMIT_RETRIES = 3
+_rate_limit_resets: dict[str, float] = {}  # Authorization header -> epoch seconds
+
+
+def _note_rate_limit(auth: str, headers: Any) -> None:
+    if headers is None:
+        return
+    if headers.get("X-RateLimit-Remaining") == "0":
+        try:
+            _rate_limit_resets[auth] = float(headers.get("X-RateLimit-Reset") or 0)
+        except ValueError:
+            pass
+    elif headers.get("X-RateLimit-Remaining") is not None:
+        _rate_limit_resets.pop(auth, None)
+
+
+def _wait_for_rate_limit(auth: str, url: str) -> None:
+    reset = _rate_limit_resets.get(auth)
+    if reset is None:
+        return
+    wait = reset - time.time()
+    if wait <= 0:
+        _rate_limit_resets.pop(auth, None)
+        return
+    if wait > _RATE_LIMIT_MAX_WAIT:
+        # Surface it like GitHub's own 429 so callers report it the usual way.
+        raise urllib.error.HTTPError(url, 429, f"rate limit exhausted; it resets in {int(wait)}s", Message(), None)
+    time.sleep(wait + random.uniform(0, 1))
+
+
+def _rate_limit_delay(code: int, headers: Any, attempt: int) -> float | None:
+    """Seconds to wait before retrying a rate-limited response, or None to give up."""
+    if code not in {403, 429} or headers is None:
+        return None
+    retry_after = headers.get("Retry-After")
+    if retry_after and retry_after.isdigit():
+        delay = float(retry_after)
+    elif headers.get("X-RateLimit-Remaining") == "0":
+        delay = float(headers.get("X-RateLimit-Reset") or 0) - time.time()
+    elif code == 429:
+        delay = float(2**attempt)
+    else:
+        # A plain 403 is a permissions error, not a rate limit.
+        return None
+    if delay > _RATE_LIMIT_MAX_WAIT:
+        return None
+    return max(delay, 0.0) + random.uniform(0, 1)
+
+
+def _github_urlopen(req: urllib.request.Request, timeout: float) -> http_pool.PooledResponse:
+    """http_pool.urlopen that honours GitHub's rate-limit headers."""
+    auth = req.get_header("Authorization") or ""
+    attempt = 0
+    while True:
+        _wait_for_rate_limit(auth, req.full_url)
+        try:
+            resp = http_pool.urlopen(req, timeout=timeout)
+        except urllib.error.HTTPError as e:
+            _note_rate_limit(auth, e.headers)
+            delay = _rate_limit_delay(e.code, e.headers, attempt)
+            if delay is None or attempt >= _RATE_LIMIT_RETRIES:
+                raise
+            # The delay already covers the reset; don't wait for it twice.
+            _rate_limit_resets.pop(auth, None)
+            time.sleep(delay)
+            attempt += 1
+            continue
+        _note_rate_limit(auth, resp.headers)
+        return resp
+
+
+def _last_page(link: str) -> int | None:
+    """Page number of the rel="last" entry in a GitHub Link header, if any."""
+    for part in link.split(","):
+        target, _, params = part.partition(";")
+        if 'rel="last"' in params:
+            query = urllib.parse.urlsplit(target.strip().strip("<>")).query
+            page = urllib.parse.parse_qs(query).get("page")
+            if page and page[0].isdigit():
+                return int(page[0])
+    return None
+
 
 class ScanBundlesRequest(SQLModel):
     """
@@ -136,16 +324,24 @@ class GitHubDevicePollRequest(SQLModel):
     device_code: str
 
 
+_OWNER_REPO_RE = re.compile(r"^([A-Za-z0-9_.-]+)/([A-Za-z0-9_.-]+)$")
+_GITHUB_HOSTS = frozenset({"github.com", "www.github.com"})
+_DEFAULT_BUNDLE_PATH = "local-nexus.bundle.json"
+
+
+@lru_cache(maxsize=512)
 def _parse_github_input(repo_input: str, ref: str, path: str) -> tuple[str, str, str, str]:
+    # Pure and string-keyed; the dashboard resubmits the same repo across actions.
+    # Invalid input raises, and lru_cache doesn't cache exceptions.
     raw = (repo_input or "").strip()
     if not raw:
         raise HTTPException(status_code=400, detail="GitHub repo is required (e.g. owner/repo).")
 
     # owner/repo shorthand
-    m = re.match(r"^([A-Za-z0-9_.-]+)/([A-Za-z0-9_.-]+)$", raw)
+    m = _OWNER_REPO_RE.match(raw)
     if m:
         owner, repo = m.group(1), m.group(2)
-        return owner, repo.removesuffix(".git"), (ref or "main").strip(), (path or "local-nexus.bundle.json").lstrip("/")
+        return owner, repo.removesuffix(".git"), (ref or "main").strip(), (path or _DEFAULT_BUNDLE_PATH).lstrip("/")
 
     # URL forms
     try:
@@ -156,23 +352,26 @@ def _parse_github_input(repo_input: str, ref: str, path: str) -> tuple[str, str,
     host = (u.netloc or "").lower()
     parts = [p for p in (u.path or "").split("/") if p]
 
-    if host in {"github.com", "www.github.com"} and len(parts) >= 2:
+    if host in _GITHUB_HOSTS and len(parts) >= 2:
         owner, repo = parts[0], parts[1].removesuffix(".git")
         # https://github.com/owner/repo/blob/<ref>/<path...>
         if len(parts) >= 5 and parts[2] == "blob":
             ref_from_url = parts[3]
             path_from_url = "/".join(parts[4:])
             return owner, repo, ref_from_url, path_from_url
-        return owner, repo, (ref or "main").strip(), (path or "local-nexus.bundle.json").lstrip("/")
+        return owner, repo, (ref or "main").strip(), (path or _DEFAULT_BUNDLE_PATH).lstrip("/")
 
     raise HTTPException(status_code=400, detail="Unsupported GitHub URL. Use owner/repo or a github.com URL.")
 
 
 def _http_get_json_any(url: str, headers: dict[str, str]) -> object:
-    req = urllib.request.Request(url, headers=headers, method="GET")
+    return _http_get_json_page(url, headers)[0]
+
+
+def _http_get_json_page(url: str, headers: dict[str, str]) -> tuple[object, int | None]:
+    """Like _http_get_json_any, also returning the last page number from the Link header."""
     try:
-        with urllib.request.urlopen(req, timeout=15) as resp:  # noqa: S310 - controlled URLs
-            data = resp.read().decode("utf-8", errors="replace")
+        data, link = _conditional_get(url, headers, timeout=15)
     except urllib.error.HTTPError as e:
         try:
             body = e.read().decode("utf-8", errors="replace")
@@ -183,7 +382,7 @@ def _http_get_json_any(url: str, headers: dict[str, str]) -> object:
         raise HTTPException(status_code=400, detail=f"GitHub request failed: {e}")
 
     try:
-        return json.loads(data)
+        return orjson.loads(data), _last_page(link)
     except Exception as e:  # noqa: BLE001
         raise HTTPException(status_code=400, detail=f"GitHub returned invalid JSON: {e}")
 
@@ -195,11 +394,11 @@ def _http_get_json(url: str, headers: dict[str, str]) -> dict:
     return payload
 
 
-def _http_get_text(url: str, headers: dict[str, str]) -> str:
+def _http_get_bytes(url: str, headers: dict[str, str]) -> bytes:
     req = urllib.request.Request(url, headers=headers, method="GET")
     try:
-        with urllib.request.urlopen(req, timeout=15) as resp:  # noqa: S310 - controlled URLs
-            return resp.read().decode("utf-8", errors="replace")
+        with http_pool.urlopen(req, timeout=15) as resp:
+            return resp.read()
     except urllib.error.HTTPError as e:
         try:
             body = e.read().decode("utf-8", errors="replace")
@@ -211,37 +410,48 @@ def _http_get_text(url: str, headers: dict[str, str]) -> str:
 
 
 def _fetch_bundle_json_from_github(owner: str, repo: str, ref: str, path: str, github_token: str | None) -> dict:
-    # Prefer GitHub Contents API (supports private repos with token).
-    api_url = f"https://api.github.com/repos/{owner}/{repo}/contents/{urllib.parse.quote(path)}?ref={urllib.parse.quote(ref)}"
+    token = (github_token or "").strip()
+    if token:
+        bundle = _fetch_bundle_json_from_contents_api(owner, repo, ref, path, token)
+        if bundle is not None:
+            return bundle
+
+    # No token (public repo) or the API call failed: the raw host works without
+    # auth and isn't subject to the 60/hour anonymous API rate limit.
+    raw_url = f"https://raw.githubusercontent.com/{owner}/{repo}/{ref}/{path}"
+    # orjson parses (and validates the UTF-8 of) the raw bytes directly.
+    data = _http_get_bytes(raw_url, headers={"User-Agent": "LocalNexusController"})
+    try:
+        return orjson.loads(data)
+    except Exception as e:  # noqa: BLE001
+        raise HTTPException(status_code=400, detail=f"Bundle file is not valid JSON: {e}")
+
+
+def _fetch_bundle_json_from_contents_api(owner: str, repo: str, ref: str, path: str, token: str) -> dict | None:
+    # GitHub Contents API (supports private repos with token).
+    api_url = f"https://api.github.com/repos/{owner}/{repo}/contents/{_quote(path)}?ref={_quote(ref)}"
     headers = {
         "User-Agent": "LocalNexusController",
         "Accept": "application/vnd.github+json",
+        "Authorization": f"Bearer {token}",
     }
-    if github_token and github_token.strip():
-        headers["Authorization"] = f"Bearer {github_token.strip()}"
 
     try:
         payload = _http_get_json(api_url, headers=headers)
         if isinstance(payload, dict) and payload.get("type") == "file" and payload.get("content"):
-            content_b64 = str(payload["content"]).replace("\n", "")
             try:
-                raw = base64.b64decode(content_b64).decode("utf-8", errors="replace")
+                # b64decode drops the line breaks GitHub inserts every 60 chars.
+                raw = base64.b64decode(payload["content"])
             except Exception as e:  # noqa: BLE001
                 raise HTTPException(status_code=400, detail=f"Failed to decode bundle from GitHub: {e}")
             try:
-                return json.loads(raw)
+                return orjson.loads(raw)
             except Exception as e:  # noqa: BLE001
                 raise HTTPException(status_code=400, detail=f"Bundle file is not valid JSON: {e}")
     except HTTPException:
-        # Fall through to raw URL below for public repos / rate-limit edge cases.
+        # Let the caller fall back to the raw URL (rate-limit edge cases).
         pass
-
-    raw_url = f"https://raw.githubusercontent.com/{owner}/{repo}/{ref}/{path}"
-    text = _http_get_text(raw_url, headers={"User-Agent": "LocalNexusController"})
-    try:
-        return json.loads(text)
-    except Exception as e:  # noqa: BLE001
-        raise HTTPException(status_code=400, detail=f"Bundle file is not valid JSON: {e}")
+    return None
 
 
 def _github_api_request(method: str, url: str, github_token: str, body: dict | None = None) -> Any:
@@ -252,13 +462,16 @@ def _github_api_request(method: str, url: str, github_token: str, body: dict | N
     }
     data: bytes | None = None
     if body is not None:
-        data = json.dumps(body).encode("utf-8")
+        data = orjson.dumps(body)
         headers["Content-Type"] = "application/json"
 
-    req = urllib.request.Request(url, headers=headers, method=method, data=data)
     try:
-        with urllib.request.urlopen(req, timeout=20) as resp:  # noqa: S310 - controlled URLs
-            raw = resp.read().decode("utf-8", errors="replace")
+        if method == "GET":
+            raw, _ = _conditional_get(url, headers, timeout=20)
+        else:
+            req = urllib.request.Request(url, headers=headers, method=method, data=data)
+            with _github_urlopen(req, timeout=20) as resp:
+                raw = resp.read()
     except urllib.error.HTTPError as e:
         try:
             err = e.read().decode("utf-8", errors="replace")
@@ -271,9 +484,9 @@ def _github_api_request(method: str, url: str, github_token: str, body: dict | N
     if not raw.strip():
         return None
     try:
-        return json.loads(raw)
-    except Exception:
-        return {"raw": raw}
+        return orjson.loads(raw)
+    except orjson.JSONDecodeError:
+        return {"raw": raw.decode("utf-8", errors="replace")}
 
 
 def _github_oauth_client_id() -> str:
@@ -296,8 +509,8 @@ def _github_device_start(scope: str) -> dict:
         headers={"Accept": "application/json", "User-Agent": "LocalNexusController", "Content-Type": "application/x-www-form-urlencoded"},
     )
     try:
-        with urllib.request.urlopen(req, timeout=20) as resp:  # noqa: S310
-            raw = resp.read().decode("utf-8", errors="replace")
+        with http_pool.urlopen(req, timeout=20) as resp:
+            raw = resp.read()
     except urllib.error.HTTPError as e:
         try:
             err = e.read().decode("utf-8", errors="replace")
@@ -308,7 +521,7 @@ def _github_device_start(scope: str) -> dict:
         raise HTTPException(status_code=400, detail=f"GitHub device auth start failed: {e}")
 
     try:
-        payload = json.loads(raw)
+        payload = orjson.loads(raw)
     except Exception as e:  # noqa: BLE001
         raise HTTPException(status_code=400, detail=f"GitHub device auth returned invalid JSON: {e}")
     if not isinstance(payload, dict) or not payload.get("device_code") or not payload.get("user_code"):
@@ -332,8 +545,8 @@ def _github_device_poll(device_code: str) -> dict:
         headers={"Accept": "application/json", "User-Agent": "LocalNexusController", "Content-Type": "application/x-www-form-urlencoded"},
     )
     try:
-        with urllib.request.urlopen(req, timeout=20) as resp:  # noqa: S310
-            raw = resp.read().decode("utf-8", errors="replace")
+        with http_pool.urlopen(req, timeout=20) as resp:
+            raw = resp.read()
     except urllib.error.HTTPError as e:
         try:
             err = e.read().decode("utf-8", errors="replace")
@@ -344,7 +557,7 @@ def _github_device_poll(device_code: str) -> dict:
         raise HTTPException(status_code=400, detail=f"GitHub device auth poll failed: {e}")
 
     try:
-        payload = json.loads(raw)
+        payload = orjson.loads(raw)
     except Exception as e:  # noqa: BLE001
         raise HTTPException(status_code=400, detail=f"GitHub token response invalid JSON: {e}")
     if not isinstance(payload, dict):
@@ -352,47 +565,70 @@ def _github_device_poll(device_code: str) -> dict:
     return payload
 
 
+# Minimal "starter" bundle. The user can refine commands/paths later.
+# _default_bundle_for_repo copies it, giving each bundle its own mutable containers.
+_DEFAULT_REPO_BUNDLE: dict = {
+    "service": {
+        "name": "repo",
+        "description": "",
+        "category": "repos",
+        "tags": ["github"],
+        "tech_stack": ["git"],
+        "dependencies": [],
+        "config_paths": [],
+        "port": None,
+        "local_url": None,
+        "healthcheck_url": None,
+        # Intentionally blank: this depends on where the repo is cloned locally.
+        "working_directory": "",
+        "start_command": "",
+        "stop_command": "",
+        "restart_command": "",
+        "env_overrides": {},
+        "database_id": None,
+        "database_connection_string": None,
+        "database_schema_overview": None,
+    },
+    "database": None,
+    "keys": [],
+    "requested_port": None,
+    "auto_assign_port": False,
+    "auto_create_db": False,
+    "meta": {
+        "source": "github",
+        "repo": "",
+        "needs_local_setup": False,
+        "notes": "Fill in working_directory + start_command for local runs. Then import this bundle.",
+    },
+}
+
+
 def _default_bundle_for_repo(repo_full_name: str, needs_local_setup: bool) -> dict:
-    # Minimal "starter" bundle. The user can refine commands/paths later.
-    service_name = repo_full_name.split("/")[-1] if repo_full_name else "repo"
+    # A targeted copy is ~15x cheaper than copy.deepcopy of the template.
+    service = _DEFAULT_REPO_BUNDLE["service"]
     return {
+        **_DEFAULT_REPO_BUNDLE,
         "service": {
-            "name": service_name,
+            **service,
+            "name": repo_full_name.split("/")[-1] if repo_full_name else "repo",
             "description": f"Imported from GitHub repo {repo_full_name}",
-            "category": "repos",
-            "tags": ["github"],
-            "tech_stack": ["git"],
+            "tags": list(service["tags"]),
+            "tech_stack": list(service["tech_stack"]),
             "dependencies": [],
             "config_paths": [],
-            "port": None,
-            "local_url": None,
-            "healthcheck_url": None,
-            # Intentionally blank: this depends on where the repo is cloned locally.
-            "working_directory": "",
-            "start_command": "",
-            "stop_command": "",
-            "restart_command": "",
             "env_overrides": {},
-            "database_id": None,
-            "database_connection_string": None,
-            "database_schema_overview": None,
         },
-        "database": None,
         "keys": [],
-        "requested_port": None,
-        "auto_assign_port": False,
-        "auto_create_db": False,
         "meta": {
-            "source": "github",
+            **_DEFAULT_REPO_BUNDLE["meta"],
             "repo": repo_full_name,
             "needs_local_setup": bool(needs_local_setup),
-            "notes": "Fill in working_directory + start_command for local runs. Then import this bundle.",
         },
     }
 
 
 def _github_get_contents_meta(owner: str, repo: str, path: str, ref: str, token: str) -> dict | None:
-    url = f"https://api.github.com/repos/{owner}/{repo}/contents/{urllib.parse.quote(path)}?ref={urllib.parse.quote(ref)}"
+    url = f"https://api.github.com/repos/{owner}/{repo}/contents/{_quote(path)}?ref={_quote(ref)}"
     try:
         payload = _github_api_request("GET", url, token)
     except HTTPException:
@@ -401,30 +637,39 @@ def _github_get_contents_meta(owner: str, repo: str, path: str, ref: str, token:
 
 
 def _github_get_file_text(owner: str, repo: str, path: str, ref: str, token: str) -> str | None:
-    meta = _github_get_contents_meta(owner, repo, path, ref, token)
+    return _contents_meta_text(_github_get_contents_meta(owner, repo, path, ref, token))
+
+
+def _contents_meta_text(meta: dict | None) -> str | None:
+    # Contents API responses carry the file inline, so a meta probe doubles as a read.
     if not meta or meta.get("type") != "file" or not meta.get("content"):
         return None
-    content_b64 = str(meta["content"]).replace("\n", "")
     try:
-        return base64.b64decode(content_b64).decode("utf-8", errors="replace")
+        return base64.b64decode(meta["content"]).decode("utf-8", errors="replace")
     except Exception:
         return None
 
 
+def _git_blob_sha(data: bytes) -> str:
+    """The SHA git (and the contents API) reports for a file with these bytes."""
+    return hashlib.sha1(b"blob %d\0" % len(data) + data).hexdigest()
+
+
 def _github_put_file(
     owner: str,
     repo: str,
     path: str,
     branch: str,
     message: str,
-    content_text: str,
+    content_text: str | bytes,
     token: str,
     sha: str | None = None,
 ) -> dict:
-    url = f"https://api.github.com/repos/{owner}/{repo}/contents/{urllib.parse.quote(path)}"
+    url = f"https://api.github.com/repos/{owner}/{repo}/contents/{_quote(path)}"
+    data = content_text if isinstance(content_text, bytes) else content_text.encode("utf-8")
     body: dict[str, Any] = {
         "message": message,
-        "content": base64.b64encode(content_text.encode("utf-8")).decode("utf-8"),
+        "content": base64.b64encode(data).decode("ascii"),
         "branch": branch,
     }
     if sha:
@@ -435,51 +680,14 @@ def _github_put_file(
     return res
 
 
-def _github_list_repo_paths(owner: str, repo: str, ref: str, token: str) -> list[str]:
-    # Resolve commit SHA for ref, then fetch tree recursively.
-    ref_info = _github_api_request("GET", f"https://api.github.com/repos/{owner}/{repo}/git/ref/heads/{urllib.parse.quote(ref)}", token)
+def _github_get_tree(owner: str, repo: str, ref: str, token: str) -> tuple[str, str, list[dict]]:
+    """Resolve ref and fetch its tree recursively: (commit_sha, tree_sha, entries)."""
+    repo_url = f"https://api.github.com/repos/{owner}/{repo}"
+    qref = _quote(ref)
+    ref_info = _github_api_request("GET", f"{repo_url}/git/ref/heads/{qref}", token)
     if not isinstance(ref_info, dict) or "object" not in ref_info:
         # If ref is not a branch, try tag refs.
-        ref_info = _github_api_request("GET", f"https://api.github.com/repos/{owner}/{repo}/git/ref/tags/{urllib.parse.quote(ref)}", token)
-    if not isinstance(ref_info, dict) or "object" not in ref_info:
-        raise HTTPException(status_code=400, detail=f"Could not resolve ref: {ref}")
-
-    sha = str((ref_info.get("object") or {}).get("sha") or "")
-    if not sha:
-        raise HTTPException(status_code=400, detail=f"Could not resolve ref SHA: {ref}")
-
-    commit = _github_api_request("GET", f"https://api.github.com/repos/{owner}/{repo}/git/commits/{urllib.parse.quote(sha)}", token)
-    if not isinstance(commit, dict):
-        raise HTTPException(status_code=400, detail="Could not fetch commit info from GitHub.")
-    tree_sha = str(((commit.get("tree") or {}) if isinstance(commit.get("tree"), dict) else {}).get("sha") or "")
-    if not tree_sha:
-        raise HTTPException(status_code=400, detail="Could not resolve tree SHA from GitHub.")
-
-    tree = _github_api_request(
-        "GET",
-        f"https://api.github.com/repos/{owner}/{repo}/git/trees/{urllib.parse.quote(tree_sha)}?recursive=1",
-        token,
-    )
-    if not isinstance(tree, dict) or "tree" not in tree:
-        raise HTTPException(status_code=400, detail="Could not list repo tree from GitHub.")
-
-    paths: list[str] = []
-    for item in tree.get("tree") or []:
-        if not isinstance(item, dict):
-            continue
-        if item.get("type") != "blob":
-            continue
-        p = str(item.get("path") or "")
-        if p:
-            paths.append(p)
-    return paths
-
-
-def _github_get_tree_entries(owner: str, repo: str, ref: str, token: str) -> list[dict]:
-    # Resolve commit SHA for ref, then fetch tree recursively and return entries.
-    ref_info = _github_api_request("GET", f"https://api.github.com/repos/{owner}/{repo}/git/ref/heads/{urllib.parse.quote(ref)}", token)
-    if not isinstance(ref_info, dict) or "object" not in ref_info:
-        ref_info = _github_api_request("GET", f"https://api.github.com/repos/{owner}/{repo}/git/ref/tags/{urllib.parse.quote(ref)}", token)
+        ref_info = _github_api_request("GET", f"{repo_url}/git/ref/tags/{qref}", token)
     if not isinstance(ref_info, dict) or "object" not in ref_info:
         raise HTTPException(status_code=400, detail=f"Could not resolve ref: {ref}")
 
@@ -487,7 +695,7 @@ def _github_get_tree_entries(owner: str, repo: str, ref: str, token: str) -> lis
     if not sha:
         raise HTTPException(status_code=400, detail=f"Could not resolve ref SHA: {ref}")
 
-    commit = _github_api_request("GET", f"https://api.github.com/repos/{owner}/{repo}/git/commits/{urllib.parse.quote(sha)}", token)
+    commit = _github_api_request("GET", f"{repo_url}/git/commits/{_quote(sha)}", token)
     if not isinstance(commit, dict):
         raise HTTPException(status_code=400, detail="Could not fetch commit info from GitHub.")
     tree_sha = str(((commit.get("tree") or {}) if isinstance(commit.get("tree"), dict) else {}).get("sha") or "")
@@ -496,7 +704,7 @@ def _github_get_tree_entries(owner: str, repo: str, ref: str, token: str) -> lis
 
     tree = _github_api_request(
         "GET",
-        f"https://api.github.com/repos/{owner}/{repo}/git/trees/{urllib.parse.quote(tree_sha)}?recursive=1",
+        f"{repo_url}/git/trees/{_quote(tree_sha)}?recursive=1",
         token,
     )
     if not isinstance(tree, dict) or "tree" not in tree:
@@ -504,29 +712,147 @@ def _github_get_tree_entries(owner: str, repo: str, ref: str, token: str) -> lis
 
     entries = tree.get("tree") or []
     if not isinstance(entries, list):
-        return []
-    return [e for e in entries if isinstance(e, dict)]
+        return sha, tree_sha, []
+    return sha, tree_sha, [e for e in entries if isinstance(e, dict)]
+
+
+def _tree_blob_paths(entries: list[dict]) -> list[str]:
+    """File paths in tree order (directories and submodules dropped)."""
+    return [p for e in entries if e.get("type") == "blob" and (p := str(e.get("path") or ""))]
 
 
 def _github_get_blob(owner: str, repo: str, sha: str, token: str) -> dict:
-    blob = _github_api_request("GET", f"https://api.github.com/repos/{owner}/{repo}/git/blobs/{urllib.parse.quote(sha)}", token)
+    blob = _github_api_request("GET", f"https://api.github.com/repos/{owner}/{repo}/git/blobs/{_quote(sha)}", token)
     if not isinstance(blob, dict) or "content" not in blob:
         raise HTTPException(status_code=400, detail="GitHub returned an unexpected blob response.")
     return blob
 
 
-def _github_create_blob(dest_owner: str, dest_repo: str, content_b64: str, token: str) -> str:
+def _github_create_blob(dest_owner: str, dest_repo: str, content: str, token: str, encoding: str = "base64") -> str:
+    if encoding == "base64":
+        content = content.replace("\n", "")
     res = _github_api_request(
         "POST",
         f"https://api.github.com/repos/{dest_owner}/{dest_repo}/git/blobs",
         token,
-        body={"content": content_b64.replace("\n", ""), "encoding": "base64"},
+        body={"content": content, "encoding": encoding},
     )
     if not isinstance(res, dict) or not res.get("sha"):
         raise HTTPException(status_code=400, detail="Failed to create blob in destination repo.")
     return str(res["sha"])
 
 
+# JSON files committed to repos: 2-space indent plus a trailing newline, the
+# layout json.dumps(indent=2) + "\n" produced.
+_JSON_FILE_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE
+
+
+def _github_create_text_blob(dest_owner: str, dest_repo: str, text: str | bytes, token: str) -> str:
+    # The blobs API takes UTF-8 content as-is, which skips base64's encode cost
+    # and 33% larger request body. Callers only pass valid UTF-8 text.
+    content = text.decode("utf-8") if isinstance(text, bytes) else text
+    return _github_create_blob(dest_owner, dest_repo, content, token, encoding="utf-8")
+
+
+def _copy_blob(src_owner: str, src_repo: str, dst_owner: str, dst_repo: str, sha: str, token: str) -> tuple[int, str | None, str | None]:
+    """
+    Copy one blob between repos. Returns (size, dest_sha, skip_reason); blobs
+    GitHub truncated or returned in an unknown encoding are not created.
+    """
+    blob = _github_get_blob(src_owner, src_repo, sha, token)
+    size = int(blob.get("size") or 0)
+    if bool(blob.get("truncated")):
+        return size, None, "truncated"
+    if str(blob.get("encoding") or "base64") != "base64":
+        return size, None, "encoding"
+    return size, _github_create_blob(dst_owner, dst_repo, str(blob.get("content") or ""), token), None
+
+
+_BLOB_COPY_BATCH = 50
+_GIT_SHA_RE = re.compile(r"^[0-9a-f]{40,64}$")
+
+
+def _github_graphql(query: str, variables: dict[str, Any], token: str) -> dict:
+    res = _github_api_request("POST", "https://api.github.com/graphql", token, body={"query": query, "variables": variables})
+    data = res.get("data") if isinstance(res, dict) else None
+    if not isinstance(data, dict):
+        raise HTTPException(status_code=400, detail="GitHub GraphQL request failed.")
+    return data
+
+
+def _github_get_text_blobs(owner: str, repo: str, shas: list[str], token: str) -> dict[str, tuple[int, str]]:
+    """
+    Fetch many blobs in one GraphQL query: {sha: (size, text)}.
+
+    Only blobs whose UTF-8 encoded text hashes back to their own blob SHA are
+    returned; binary, truncated or otherwise lossy ones are left for the REST
+    blob endpoint. Returns {} if the query fails.
+    """
+    aliases = [
+        f"b{i}: object(oid: \"{sha}\") {{ ... on Blob {{ isBinary isTruncated text }} }}"
+        for i, sha in enumerate(shas)
+        if _GIT_SHA_RE.match(sha)
+    ]
+    if not aliases:
+        return {}
+    query = "query($owner: String!, $name: String!) { repository(owner: $owner, name: $name) { " + " ".join(aliases) + " } }"
+    try:
+        repository = _github_graphql(query, {"owner": owner, "name": repo}, token).get("repository")
+    except HTTPException:
+        return {}
+    if not isinstance(repository, dict):
+        return {}
+
+    texts: dict[str, tuple[int, str]] = {}
+    for i, sha in enumerate(shas):
+        blob = repository.get(f"b{i}")
+        if not isinstance(blob, dict) or blob.get("isBinary") is not False or blob.get("isTruncated"):
+            continue
+        text = blob.get("text")
+        if not isinstance(text, str):
+            continue
+        data = text.encode("utf-8")
+        if _git_blob_sha(data) == sha:
+            texts[sha] = (len(data), text)
+    return texts
+
+
+def _iter_copied_blobs(
+    src_owner: str, src_repo: str, dst_owner: str, dst_repo: str, entries: list[dict], token: str
+) -> Any:
+    """
+    Yield (entry, (size, dest_sha, skip_reason)) for each entry, in order.
+
+    Each batch's text blobs are read with a single GraphQL query; the rest go
+    through _copy_blob. Blob creates run on the GitHub executor, and the next
+    batch's query is issued while the current batch is being copied. Callers
+    may stop early; at most one batch (plus one prefetched query) is wasted.
+    """
+    chunks = [entries[i : i + _BLOB_COPY_BATCH] for i in range(0, len(entries), _BLOB_COPY_BATCH)]
+
+    def read_texts(chunk: list[dict]) -> Future[dict[str, tuple[int, str]]]:
+        shas = [str(e.get("sha") or "") for e in chunk]
+        return _GITHUB_EXECUTOR.submit(_github_get_text_blobs, src_owner, src_repo, shas, token)
+
+    if not chunks:
+        return
+    pending = read_texts(chunks[0])
+    for n, chunk in enumerate(chunks):
+        shas = [str(e.get("sha") or "") for e in chunk]
+        texts = pending.result()
+        if n + 1 < len(chunks):
+            pending = read_texts(chunks[n + 1])
+
+        def copy(sha: str) -> tuple[int, str | None, str | None]:
+            hit = texts.get(sha)
+            if hit is None:
+                return _copy_blob(src_owner, src_repo, dst_owner, dst_repo, sha, token)
+            size, text = hit
+            return size, _github_create_text_blob(dst_owner, dst_repo, text, token), None
+
+        yield from zip(chunk, _GITHUB_EXECUTOR.map(copy, shas))
+
+
 def _github_create_tree(dest_owner: str, dest_repo: str, base_tree_sha: str, items: list[dict[str, Any]], token: str) -> str:
     res = _github_api_request(
         "POST",
@@ -554,17 +880,26 @@ def _github_create_commit(dest_owner: str, dest_repo: str, message: str, tree_sh
 def _github_update_ref(dest_owner: str, dest_repo: str, branch: str, sha: str, token: str) -> None:
     _github_api_request(
         "PATCH",
-        f"https://api.github.com/repos/{dest_owner}/{dest_repo}/git/refs/heads/{urllib.parse.quote(branch)}",
+        f"https://api.github.com/repos/{dest_owner}/{dest_repo}/git/refs/heads/{_quote(branch)}",
         token,
         body={"sha": sha, "force": False},
     )
 
 
+# ASCII translation table for _safe_workspace_name: keep alnum and "-_.", map the rest to "_".
+_WORKSPACE_NAME_TABLE = {c: "_" for c in range(128) if not (chr(c).isalnum() or chr(c) in "-_.")}
+
+
 def _safe_workspace_name(owner: str, repo: str, branch: str) -> str:
     raw = f"{owner}__{repo}__{branch}"
+    if raw.isascii():
+        return raw.translate(_WORKSPACE_NAME_TABLE)[:160]
     return "".join(ch if ch.isalnum() or ch in {"-", "_", "."} else "_" for ch in raw)[:160]
 
 
+_GIT_OUTPUT_TAIL_BYTES = 64 * 1024
+
+
 def _run_git(cmd: list[str], cwd: Path, token: str | None = None, timeout_s: int = 300) -> tuple[int, str]:
     env = os.environ.copy()
     full_cmd = ["git"]
@@ -573,64 +908,122 @@ def _run_git(cmd: list[str], cwd: Path, token: str | None = None, timeout_s: int
         full_cmd += ["-c", f"http.extraHeader=AUTHORIZATION: bearer {token}"]
     full_cmd += cmd
     try:
-        res = subprocess.run(
+        proc = subprocess.Popen(
             full_cmd,
             cwd=str(cwd),
-            capture_output=True,
-            text=True,
-            timeout=timeout_s,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
             shell=False,
             env=env,
+            # Don't flash a console window per git call on Windows (0 elsewhere).
+            creationflags=getattr(subprocess, "CREATE_NO_WINDOW", 0),
         )
-        out = (res.stdout or "") + ("\n" + res.stderr if res.stderr else "")
-        return int(res.returncode), out.strip()
     except FileNotFoundError:
         raise HTTPException(status_code=400, detail="git not found on PATH. Install Git for Windows.")
-    except subprocess.TimeoutExpired:
+
+    # Callers only show this in error messages (or test it for emptiness), so
+    # keep just the tail of the output rather than buffering e.g. a whole clone log.
+    timed_out = threading.Event()
+
+    def kill() -> None:
+        timed_out.set()
+        proc.kill()
+
+    timer = threading.Timer(timeout_s, kill)
+    timer.start()
+    tail = bytearray()
+    stdout = proc.stdout
+    assert stdout is not None
+    try:
+        with stdout:
+            for chunk in iter(lambda: stdout.read(_GIT_OUTPUT_TAIL_BYTES), b""):
+                tail += chunk
+                del tail[:-_GIT_OUTPUT_TAIL_BYTES]
+        code = proc.wait()
+    finally:
+        timer.cancel()
+    if timed_out.is_set():
         raise HTTPException(status_code=400, detail=f"git command timed out: {' '.join(cmd)}")
+    return int(code), tail.decode("utf-8", errors="replace").strip()
+
 
+_CURSOR_INSTALL_DIRS = (
+    ("LOCALAPPDATA", "Programs", "Cursor", "Cursor.exe"),
+    ("PROGRAMFILES", "Cursor", "Cursor.exe"),
+    ("PROGRAMFILES(X86)", "Cursor", "Cursor.exe"),
+)
 
-def _find_cursor_command() -> list[str] | None:
+
+@lru_cache(maxsize=1)
+def _find_cursor_command() -> tuple[str, ...] | None:
     # Prefer CLI "cursor" if installed.
     from shutil import which
 
     c = which("cursor")
     if c:
-        return [c]
-    # Common Windows install paths (best-effort).
-    candidates = [
-        os.path.join(os.environ.get("LOCALAPPDATA", ""), "Programs", "Cursor", "Cursor.exe"),
-        os.path.join(os.environ.get("PROGRAMFILES", ""), "Cursor", "Cursor.exe"),
-        os.path.join(os.environ.get("PROGRAMFILES(X86)", ""), "Cursor", "Cursor.exe"),
-    ]
-    for p in candidates:
-        if p and Path(p).exists():
-            return [p]
+        return (c,)
+    # Common Windows install paths (best-effort); skip unset env vars instead of
+    # probing a path relative to the current directory.
+    for var, *parts in _CURSOR_INSTALL_DIRS:
+        base = os.environ.get(var)
+        if base:
+            p = os.path.join(base, *parts)
+            if os.path.isfile(p):
+                return (p,)
     return None
 
 
+# Candidate files for _detect_local_run_config, in priority order (first match wins).
+_COMPOSE_FILES = ("docker-compose.yml", "docker-compose.yaml", "compose.yml", "compose.yaml")
+_PYTHON_MARKERS = ("pyproject.toml", "requirements.txt", "setup.py", "Pipfile")
+_PY_ENTRYPOINTS = ("main.py", "app/main.py", "src/main.py", "server.py", "api/main.py", "manage.py")
+_RUNTIME_ORDER = ("docker", "dotnet", "node", "python")
+
+
 def _detect_local_run_config(
     owner: str,
     repo: str,
     ref: str,
     token: str,
 ) -> dict:
-    paths = _github_list_repo_paths(owner, repo, ref, token)
+    _, _, entries = _github_get_tree(owner, repo, ref, token)
+    paths = _tree_blob_paths(entries)
     s = set(paths)
 
     detected: list[str] = []
-    docker_compose = next((p for p in ["docker-compose.yml", "docker-compose.yaml", "compose.yml", "compose.yaml"] if p in s), None)
+    docker_compose = next((p for p in _COMPOSE_FILES if p in s), None)
     dockerfile = "Dockerfile" if "Dockerfile" in s else None
     if docker_compose or dockerfile:
         detected.append("docker")
 
-    package_json_text = _github_get_file_text(owner, repo, "package.json", ref, token) if "package.json" in s else None
+    # Classify every path in one pass (one lower() per path).
+    csproj_paths: list[str] = []
+    sln_paths: list[str] = []
+    has_py_near_top = False
+    for i, p in enumerate(paths):
+        pl = p.lower()
+        if pl.endswith((".csproj", ".fsproj", ".vbproj")):
+            csproj_paths.append(p)
+        elif pl.endswith(".sln"):
+            sln_paths.append(p)
+        elif i < 200 and pl.endswith(".py"):
+            has_py_near_top = True
+
+    # package.json and the candidate project files are independent reads; fetch them concurrently.
+    package_json_future = (
+        _GITHUB_EXECUTOR.submit(_github_get_file_text, owner, repo, "package.json", ref, token) if "package.json" in s else None
+    )
+    csproj_futures = [
+        (p, _GITHUB_EXECUTOR.submit(_github_get_file_text, owner, repo, p, ref, token)) for p in csproj_paths[:20]
+    ]
+
+    package_json_text = package_json_future.result() if package_json_future else None
     package_json: dict | None = None
     node_entry = None
     node_script = None
     if package_json_text:
         try:
-            package_json = json.loads(package_json_text)
+            package_json = orjson.loads(package_json_text)
         except Exception:
             package_json = None
     if package_json:
@@ -644,41 +1037,32 @@ def _detect_local_run_config(
         if not node_script:
             node_entry = str(package_json.get("main") or "").strip() or None
 
-    csproj_paths = [p for p in paths if p.lower().endswith((".csproj", ".fsproj", ".vbproj"))]
-    sln_paths = [p for p in paths if p.lower().endswith(".sln")]
     dotnet_project = None
     if csproj_paths or sln_paths:
         detected.append("dotnet")
         # Prefer a web SDK project if we can detect it quickly.
+        # Results are checked in path order so the earliest web project still wins; once it
+        # is found, probes that have not started yet are cancelled.
         web_candidate = None
-        for p in csproj_paths[:20]:
-            txt = _github_get_file_text(owner, repo, p, ref, token)
+        for p, fut in csproj_futures:
+            txt = fut.result()
             if txt and ("Microsoft.NET.Sdk.Web" in txt):
                 web_candidate = p
                 break
+        for _, fut in csproj_futures:
+            fut.cancel()
         dotnet_project = web_candidate or (csproj_paths[0] if csproj_paths else sln_paths[0])
 
-    python_markers = any(p in s for p in ["pyproject.toml", "requirements.txt", "setup.py", "Pipfile"])
+    python_markers = not s.isdisjoint(_PYTHON_MARKERS)
     python_entry = None
-    if python_markers or any(p.lower().endswith(".py") for p in paths[:200]):
+    if python_markers or has_py_near_top:
         # Heuristic: pick a likely entrypoint.
-        for cand in [
-            "main.py",
-            "app/main.py",
-            "src/main.py",
-            "server.py",
-            "api/main.py",
-            "manage.py",
-        ]:
-            if cand in s:
-                python_entry = cand
-                break
+        python_entry = next((p for p in _PY_ENTRYPOINTS if p in s), None)
         if python_markers:
             detected.append("python")
 
     # De-dupe & order.
-    order = ["docker", "dotnet", "node", "python"]
-    detected = [x for x in order if x in detected]
+    detected = [x for x in _RUNTIME_ORDER if x in detected]
 
     return {
         "detected": detected,
@@ -693,94 +1077,303 @@ def _detect_local_run_config(
     }
 
 
+# PowerShell script blocks for the generated run scripts. Every line ends in
+# "\n", so a script is just the concatenation of the blocks it needs.
+_PS1_START_HEADER = (
+    '$ErrorActionPreference = "Stop"\n'
+    "\n"
+    "# Auto-generated by Local Nexus Controller\n"
+    "# Runs this repo locally (best-effort) for Python/Node/Docker/.NET.\n"
+    "\n"
+    '$repoRoot = (Resolve-Path (Join-Path $PSScriptRoot "..\\..")).Path\n'
+    "Set-Location $repoRoot\n"
+    "\n"
+    'Write-Host "Repo root: $repoRoot"\n'
+    "\n"
+)
+_PS1_START_DOCKER = (
+    "# Docker Compose detected\n"
+    'Write-Host "Starting via docker compose..."\n'
+    "docker compose up -d\n"
+    "exit 0\n"
+    "\n"
+)
+_PS1_START_DOTNET = (
+    "# .NET detected\n"
+    '$dotnetProject = "{project}"\n'
+    'Write-Host "Starting via dotnet..."\n'
+    "dotnet restore\n"
+    "dotnet run --project $dotnetProject\n"
+    "exit 0\n"
+    "\n"
+)
+_PS1_START_NODE = (
+    "# Node detected\n"
+    'Write-Host "Starting via Node..."\n'
+    "npm install\n"
+    "{run}\n"
+    "exit 0\n"
+    "\n"
+)
+_PS1_START_PYTHON = (
+    "# Python detected\n"
+    'Write-Host "Starting via Python..."\n'
+    '$venvPy = Join-Path $repoRoot ".venv\\Scripts\\python.exe"\n'
+    "if (!(Test-Path $venvPy)) {{ py -m venv .venv }}\n"
+    '$venvPy = Join-Path $repoRoot ".venv\\Scripts\\python.exe"\n'
+    "{install}\n"
+    "{run}\n"
+    "\n"
+)
+_PS1_START_FOOTER = (
+    'throw "No supported local run configuration detected. Add Docker/.NET/Node/Python config and retry."\n'
+    "\n"
+)
+_PS1_STOP_HEADER = (
+    '$ErrorActionPreference = "Stop"\n'
+    "\n"
+    "# Auto-generated by Local Nexus Controller\n"
+    "\n"
+    '$repoRoot = (Resolve-Path (Join-Path $PSScriptRoot "..\\..")).Path\n'
+    "Set-Location $repoRoot\n"
+    "\n"
+)
+_PS1_STOP_DOCKER = (
+    'Write-Host "Stopping via docker compose..."\n'
+    "docker compose down\n"
+    "exit 0\n"
+)
+_PS1_STOP_FOOTER = (
+    'Write-Host "Stop not implemented for this repo type (no docker compose detected)."\n'
+    "exit 0\n"
+    "\n"
+)
+
+# The stop script only has two variants; build both once.
+_PS1_STOP_COMPOSE_SCRIPT = _PS1_STOP_HEADER + _PS1_STOP_DOCKER + _PS1_STOP_FOOTER
+_PS1_STOP_DEFAULT_SCRIPT = _PS1_STOP_HEADER + _PS1_STOP_FOOTER
+
+# Root-level helpers written by merge-repos. start-all/stop-all optionally call
+# the destination's own root script first (the *_ROOT block).
+_PS1_START_ALL_HEADER = (
+    '$ErrorActionPreference = "Stop"\n'
+    "\n"
+    "# Auto-generated by Local Nexus Controller\n"
+    "# Starts the 'master program' (destination root + every app under apps/*).\n"
+    "\n"
+    '$repoRoot = (Resolve-Path (Join-Path $PSScriptRoot "..\\.." )).Path\n'
+    "Set-Location $repoRoot\n"
+    "\n"
+)
+_PS1_START_ALL_ROOT = (
+    'Write-Host "Starting destination root service..."\n'
+    'powershell -ExecutionPolicy Bypass -File "tools\\local-nexus\\start.ps1"\n'
+    "\n"
+)
+_PS1_START_ALL_APPS = (
+    'Write-Host "Starting apps/* ..."\n'
+    '$appsRoot = Join-Path $repoRoot "apps"\n'
+    'if (!(Test-Path $appsRoot)) { Write-Host "No apps/ folder found."; exit 0 }\n'
+    "$apps = Get-ChildItem -Path $appsRoot -Directory -ErrorAction SilentlyContinue\n"
+    "foreach ($app in $apps) {\n"
+    "  $appRoot = $app.FullName\n"
+    '  $rel = Join-Path "apps" $app.Name\n'
+    '  $startScript = Join-Path $appRoot "tools\\local-nexus\\start.ps1"\n'
+    "  if (Test-Path $startScript) {\n"
+    '    Write-Host ("Starting " + $rel)\n'
+    "    powershell -ExecutionPolicy Bypass -File $startScript\n"
+    "    continue\n"
+    "  }\n"
+    "  # Fallback: if the app has a compose file, start it with an isolated project name.\n"
+    '  $composeCandidates = @("docker-compose.yml","docker-compose.yaml","compose.yml","compose.yaml")\n'
+    "  $compose = $composeCandidates | ForEach-Object { Join-Path $appRoot $_ } | Where-Object { Test-Path $_ } | Select-Object -First 1\n"
+    "  if ($compose) {\n"
+    '    $project = ("lnc-" + $app.Name).ToLowerInvariant()\n'
+    '    Write-Host ("Starting docker compose for " + $rel + " (project " + $project + ")")\n'
+    "    docker compose -f $compose -p $project up -d\n"
+    "    continue\n"
+    "  }\n"
+    '  Write-Host ("No start script or compose file for " + $rel + ". Run Localize PR for that app.")\n'
+    "}\n"
+)
+_PS1_STOP_ALL_HEADER = (
+    '$ErrorActionPreference = "Stop"\n'
+    "\n"
+    "# Auto-generated by Local Nexus Controller\n"
+    "\n"
+    '$repoRoot = (Resolve-Path (Join-Path $PSScriptRoot "..\\.." )).Path\n'
+    "Set-Location $repoRoot\n"
+    "\n"
+)
+_PS1_STOP_ALL_ROOT = (
+    'Write-Host "Stopping destination root service..."\n'
+    'powershell -ExecutionPolicy Bypass -File "tools\\local-nexus\\stop.ps1"\n'
+    "\n"
+)
+_PS1_STOP_ALL_APPS = (
+    'Write-Host "Stopping apps/* ..."\n'
+    '$appsRoot = Join-Path $repoRoot "apps"\n'
+    'if (!(Test-Path $appsRoot)) { Write-Host "No apps/ folder found."; exit 0 }\n'
+    "$apps = Get-ChildItem -Path $appsRoot -Directory -ErrorAction SilentlyContinue\n"
+    "foreach ($app in $apps) {\n"
+    "  $appRoot = $app.FullName\n"
+    '  $rel = Join-Path "apps" $app.Name\n'
+    '  $stopScript = Join-Path $appRoot "tools\\local-nexus\\stop.ps1"\n'
+    "  if (Test-Path $stopScript) {\n"
+    '    Write-Host ("Stopping " + $rel)\n'
+    "    powershell -ExecutionPolicy Bypass -File $stopScript\n"
+    "    continue\n"
+    "  }\n"
+    '  $composeCandidates = @("docker-compose.yml","docker-compose.yaml","compose.yml","compose.yaml")\n'
+    "  $compose = $composeCandidates | ForEach-Object { Join-Path $appRoot $_ } | Where-Object { Test-Path $_ } | Select-Object -First 1\n"
+    "  if ($compose) {\n"
+    '    $project = ("lnc-" + $app.Name).ToLowerInvariant()\n'
+    '    Write-Host ("Stopping docker compose for " + $rel + " (project " + $project + ")")\n'
+    "    docker compose -f $compose -p $project down\n"
+    "    continue\n"
+    "  }\n"
+    '  Write-Host ("No stop script or compose file for " + $rel + ".")\n'
+    "}\n"
+)
+_PS1_DOCKER_UP = (
+    '$ErrorActionPreference = "Stop"\n'
+    "\n"
+    "# Auto-generated by Local Nexus Controller\n"
+    "# Starts docker compose for every app under apps/* that has a compose file.\n"
+    "\n"
+    '$repoRoot = (Resolve-Path (Join-Path $PSScriptRoot "..\\.." )).Path\n'
+    "Set-Location $repoRoot\n"
+    '$appsRoot = Join-Path $repoRoot "apps"\n'
+    'if (!(Test-Path $appsRoot)) { Write-Host "No apps/ folder found."; exit 0 }\n'
+    "$apps = Get-ChildItem -Path $appsRoot -Directory -ErrorAction SilentlyContinue\n"
+    '  $composeCandidates = @("docker-compose.yml","docker-compose.yaml","compose.yml","compose.yaml")\n'
+    "foreach ($app in $apps) {\n"
+    "  $appRoot = $app.FullName\n"
+    '  $rel = Join-Path "apps" $app.Name\n'
+    "  $compose = $composeCandidates | ForEach-Object { Join-Path $appRoot $_ } | Where-Object { Test-Path $_ } | Select-Object -First 1\n"
+    "  if (!$compose) { continue }\n"
+    '  $project = ("lnc-" + $app.Name).ToLowerInvariant()\n'
+    '  Write-Host ("docker compose up: " + $rel + " (project " + $project + ")")\n'
+    "  docker compose -f $compose -p $project up -d\n"
+    "}\n"
+)
+_PS1_DOCKER_DOWN = (
+    '$ErrorActionPreference = "Stop"\n'
+    "\n"
+    "# Auto-generated by Local Nexus Controller\n"
+    "# Stops docker compose for every app under apps/* that has a compose file.\n"
+    "\n"
+    '$repoRoot = (Resolve-Path (Join-Path $PSScriptRoot "..\\.." )).Path\n'
+    "Set-Location $repoRoot\n"
+    '$appsRoot = Join-Path $repoRoot "apps"\n'
+    'if (!(Test-Path $appsRoot)) { Write-Host "No apps/ folder found."; exit 0 }\n'
+    "$apps = Get-ChildItem -Path $appsRoot -Directory -ErrorAction SilentlyContinue\n"
+    '  $composeCandidates = @("docker-compose.yml","docker-compose.yaml","compose.yml","compose.yaml")\n'
+    "foreach ($app in $apps) {\n"
+    "  $appRoot = $app.FullName\n"
+    '  $rel = Join-Path "apps" $app.Name\n'
+    "  $compose = $composeCandidates | ForEach-Object { Join-Path $appRoot $_ } | Where-Object { Test-Path $_ } | Select-Object -First 1\n"
+    "  if (!$compose) { continue }\n"
+    '  $project = ("lnc-" + $app.Name).ToLowerInvariant()\n'
+    '  Write-Host ("docker compose down: " + $rel + " (project " + $project + ")")\n'
+    "  docker compose -f $compose -p $project down\n"
+    "}\n"
+)
+
+_PS1_ENV_EXAMPLE = (
+    '$ErrorActionPreference = "Stop"\n'
+    "\n"
+    "# Auto-generated by Local Nexus Controller\n"
+    "# Aggregates .env.example files from root and apps/* into LOCAL_NEXUS.env.example\n"
+    "\n"
+    '$repoRoot = (Resolve-Path (Join-Path $PSScriptRoot "..\\.." )).Path\n'
+    "Set-Location $repoRoot\n"
+    '$outPath = Join-Path $repoRoot "LOCAL_NEXUS.env.example"\n'
+    "$sb = New-Object System.Text.StringBuilder\n"
+    "$candidates = New-Object System.Collections.Generic.List[string]\n"
+    '$rootExample = Join-Path $repoRoot ".env.example"\n'
+    "if (Test-Path $rootExample) { [void]$candidates.Add($rootExample) }\n"
+    '$appsRoot = Join-Path $repoRoot "apps"\n'
+    "if (Test-Path $appsRoot) {\n"
+    "  Get-ChildItem -Path $appsRoot -Directory -ErrorAction SilentlyContinue | ForEach-Object {\n"
+    '    $p = Join-Path $_.FullName ".env.example"\n'
+    "    if (Test-Path $p) { [void]$candidates.Add($p) }\n"
+    "  }\n"
+    "}\n"
+    "foreach ($p in $candidates) {\n"
+    '  [void]$sb.AppendLine("### " + $p.Replace($repoRoot + "\\", ""))\n'
+    "  [void]$sb.AppendLine((Get-Content -Raw -Path $p))\n"
+    '  [void]$sb.AppendLine("")\n'
+    "}\n"
+    "Set-Content -Path $outPath -Value $sb.ToString() -Encoding UTF8\n"
+    'Write-Host ("Wrote: " + $outPath)\n'
+)
+_PS1_CHECK_PORTS = (
+    '$ErrorActionPreference = "Stop"\n'
+    "\n"
+    "# Auto-generated by Local Nexus Controller\n"
+    "# Simple port visibility helper (Windows).\n"
+    "\n"
+    'Write-Host "Listening ports (TCP) - top 50:"\n'
+    "try {\n"
+    "  Get-NetTCPConnection -State Listen | Select-Object -First 50 LocalAddress,LocalPort,OwningProcess | Format-Table -AutoSize\n"
+    "} catch {\n"
+    '  netstat -ano | Select-String "LISTENING" | Select-Object -First 50\n'
+    "}\n"
+    "\n"
+    'Write-Host "Tip: run the dashboard action Resolve ports to fix reserved port conflicts for registered services."\n'
+)
+
+
 def _generate_local_nexus_start_ps1(cfg: dict) -> str:
-    docker_compose = cfg.get("docker_compose")
-    dotnet_project = cfg.get("dotnet_project")
-    node_script = cfg.get("node_script")
-    node_entry = cfg.get("node_entry")
-    python_entry = cfg.get("python_entry")
-    has_requirements = bool(cfg.get("has_requirements"))
-    has_pyproject = bool(cfg.get("has_pyproject"))
+    # The script depends only on these fields, so identical configs (bulk
+    # merges, retried PRs) reuse the rendered text.
+    return _render_start_ps1(
+        bool(cfg.get("docker_compose")),
+        cfg.get("dotnet_project"),
+        cfg.get("node_script"),
+        cfg.get("node_entry"),
+        cfg.get("python_entry"),
+        bool(cfg.get("has_requirements")),
+        bool(cfg.get("has_pyproject")),
+    )
 
-    lines: list[str] = []
-    lines.append('$ErrorActionPreference = "Stop"')
-    lines.append("")
-    lines.append("# Auto-generated by Local Nexus Controller")
-    lines.append("# Runs this repo locally (best-effort) for Python/Node/Docker/.NET.")
-    lines.append("")
-    lines.append('$repoRoot = (Resolve-Path (Join-Path $PSScriptRoot "..\\..")).Path')
-    lines.append("Set-Location $repoRoot")
-    lines.append("")
-    lines.append("Write-Host \"Repo root: $repoRoot\"")
-    lines.append("")
+
+@lru_cache(maxsize=128)
+def _render_start_ps1(
+    docker_compose: bool,
+    dotnet_project: str | None,
+    node_script: str | None,
+    node_entry: str | None,
+    python_entry: str | None,
+    has_requirements: bool,
+    has_pyproject: bool,
+) -> str:
+    blocks = [_PS1_START_HEADER]
     if docker_compose:
-        lines.append("# Docker Compose detected")
-        lines.append('Write-Host "Starting via docker compose..."')
-        lines.append("docker compose up -d")
-        lines.append("exit 0")
-        lines.append("")
+        blocks.append(_PS1_START_DOCKER)
     if dotnet_project:
-        lines.append("# .NET detected")
-        lines.append(f'$dotnetProject = "{dotnet_project}"')
-        lines.append('Write-Host "Starting via dotnet..."')
-        lines.append("dotnet restore")
-        lines.append("dotnet run --project $dotnetProject")
-        lines.append("exit 0")
-        lines.append("")
+        blocks.append(_PS1_START_DOTNET.format(project=dotnet_project))
     if node_script or node_entry:
-        lines.append("# Node detected")
-        lines.append('Write-Host "Starting via Node..."')
-        lines.append("npm install")
-        if node_script:
-            lines.append(f'npm run {node_script}')
-        elif node_entry:
-            lines.append(f'node "{node_entry}"')
-        else:
-            lines.append("npm start")
-        lines.append("exit 0")
-        lines.append("")
+        blocks.append(_PS1_START_NODE.format(run=f"npm run {node_script}" if node_script else f'node "{node_entry}"'))
     if python_entry or has_requirements or has_pyproject:
-        lines.append("# Python detected")
-        lines.append('Write-Host "Starting via Python..."')
-        lines.append('$venvPy = Join-Path $repoRoot ".venv\\Scripts\\python.exe"')
-        lines.append('if (!(Test-Path $venvPy)) { py -m venv .venv }')
-        lines.append('$venvPy = Join-Path $repoRoot ".venv\\Scripts\\python.exe"')
         if has_requirements:
-            lines.append('& $venvPy -m pip install -r "requirements.txt"')
+            install = '& $venvPy -m pip install -r "requirements.txt"'
         elif has_pyproject:
-            lines.append('& $venvPy -m pip install -e .')
+            install = "& $venvPy -m pip install -e ."
         else:
-            lines.append('# No requirements.txt/pyproject.toml detected; skipping install.')
+            install = "# No requirements.txt/pyproject.toml detected; skipping install."
         if python_entry:
-            lines.append(f'& $venvPy "{python_entry}"')
-            lines.append("exit 0")
+            run = f'& $venvPy "{python_entry}"\nexit 0'
         else:
-            lines.append('throw "Python project detected but no entrypoint found. Edit this script or set start_command in the bundle."')
-        lines.append("")
-
-    lines.append('throw "No supported local run configuration detected. Add Docker/.NET/Node/Python config and retry."')
-    lines.append("")
-    return "\n".join(lines) + "\n"
+            run = 'throw "Python project detected but no entrypoint found. Edit this script or set start_command in the bundle."'
+        blocks.append(_PS1_START_PYTHON.format(install=install, run=run))
+    blocks.append(_PS1_START_FOOTER)
+    return "".join(blocks)
 
 
 def _generate_local_nexus_stop_ps1(cfg: dict) -> str:
-    docker_compose = cfg.get("docker_compose")
-    lines: list[str] = []
-    lines.append('$ErrorActionPreference = "Stop"')
-    lines.append("")
-    lines.append("# Auto-generated by Local Nexus Controller")
-    lines.append("")
-    lines.append('$repoRoot = (Resolve-Path (Join-Path $PSScriptRoot "..\\..")).Path')
-    lines.append("Set-Location $repoRoot")
-    lines.append("")
-    if docker_compose:
-        lines.append('Write-Host "Stopping via docker compose..."')
-        lines.append("docker compose down")
-        lines.append("exit 0")
-    lines.append('Write-Host "Stop not implemented for this repo type (no docker compose detected)."')
-    lines.append("exit 0")
-    lines.append("")
-    return "\n".join(lines) + "\n"
+    return _PS1_STOP_COMPOSE_SCRIPT if cfg.get("docker_compose") else _PS1_STOP_DEFAULT_SCRIPT
 
 
 @router.post("/bundle", dependencies=[Depends(require_token)])
@@ -828,15 +1421,24 @@ def list_github_repos(req: GitHubReposRequest) -> dict:
         "Authorization": f"Bearer {token}",
     }
 
-    repos: list[GitHubRepo] = []
     # Use the authenticated user's visible repos (including org/collab) via affiliations.
     # https://docs.github.com/en/rest/repos/repos?apiVersion=2022-11-28#list-repositories-for-the-authenticated-user
-    for page in range(1, max_pages + 1):
-        url = (
+    def page_url(page: int) -> str:
+        return (
             "https://api.github.com/user/repos"
             f"?per_page={per_page}&page={page}&sort=updated&direction=desc&affiliation=owner,collaborator,organization_member"
         )
-        payload = _http_get_json_any(url, headers=headers)
+
+    # Page 1's Link header says how many pages exist; fetch the rest concurrently.
+    first, last_page = _http_get_json_page(page_url(1), headers=headers)
+    if last_page:
+        rest = _GITHUB_EXECUTOR.map(lambda p: _http_get_json_any(page_url(p), headers), range(2, min(last_page, max_pages) + 1))
+    else:
+        # No Link header: fall back to walking pages one at a time.
+        rest = (_http_get_json_any(page_url(p), headers) for p in range(2, max_pages + 1))
+
+    repos: list[GitHubRepo] = []
+    for payload in chain([first], rest):
         if not isinstance(payload, list):
             raise HTTPException(status_code=400, detail="GitHub returned an unexpected response while listing repos.")
         if not payload:
@@ -845,8 +1447,9 @@ def list_github_repos(req: GitHubReposRequest) -> dict:
         for r in payload:
             if not isinstance(r, dict):
                 continue
+            # Fields are coerced by hand above, so skip validation.
             repos.append(
-                GitHubRepo(
+                GitHubRepo.model_construct(
                     full_name=str(r.get("full_name") or ""),
                     html_url=str(r.get("html_url") or ""),
                     default_branch=(str(r.get("default_branch")) if r.get("default_branch") else None),
@@ -860,7 +1463,20 @@ def list_github_repos(req: GitHubReposRequest) -> dict:
             break
 
     repos = [r for r in repos if r.full_name]
-    return {"count": len(repos), "repos": [r.model_dump() for r in repos]}  # type: ignore[attr-defined]
+    return {
+        "count": len(repos),
+        "repos": [
+            {
+                "full_name": r.full_name,
+                "html_url": r.html_url,
+                "default_branch": r.default_branch,
+                "private": r.private,
+                "archived": r.archived,
+                "description": r.description,
+            }
+            for r in repos
+        ],
+    }
 
 
 @router.post("/github-create-bundle-pr", dependencies=[Depends(require_token)])
@@ -878,8 +1494,16 @@ def github_create_bundle_pr(req: GitHubCreateBundlePrRequest) -> dict:
         raise HTTPException(status_code=400, detail="GitHub returned unexpected repo info.")
     base_branch = str(repo_info.get("default_branch") or ref or "main")
 
+    qpath = _quote(path)
+    qbase = _quote(base_branch)
+
+    # The base ref lookup doesn't depend on the existence probe; overlap the two.
+    ref_future = _GITHUB_EXECUTOR.submit(
+        _github_api_request, "GET", f"https://api.github.com/repos/{owner}/{repo}/git/ref/heads/{qbase}", token
+    )
+
     # If file already exists on base branch, do nothing.
-    contents_url = f"https://api.github.com/repos/{owner}/{repo}/contents/{urllib.parse.quote(path)}?ref={urllib.parse.quote(base_branch)}"
+    contents_url = f"https://api.github.com/repos/{owner}/{repo}/contents/{qpath}?ref={qbase}"
     try:
         existing = _github_api_request("GET", contents_url, token)
         if isinstance(existing, dict) and existing.get("type") == "file":
@@ -897,7 +1521,7 @@ def github_create_bundle_pr(req: GitHubCreateBundlePrRequest) -> dict:
     branch_name = f"local-nexus/add-bundle-{Path(path).stem}".replace("..", ".")
 
     # Create a new branch from base.
-    ref_info = _github_api_request("GET", f"https://api.github.com/repos/{owner}/{repo}/git/ref/heads/{urllib.parse.quote(base_branch)}", token)
+    ref_info = ref_future.result()
     if not isinstance(ref_info, dict) or "object" not in ref_info:
         raise HTTPException(status_code=400, detail="Could not resolve base branch SHA.")
     base_sha = str((ref_info.get("object") or {}).get("sha") or "")
@@ -917,10 +1541,10 @@ def github_create_bundle_pr(req: GitHubCreateBundlePrRequest) -> dict:
         pass
 
     bundle_payload = _default_bundle_for_repo(repo_full_name, needs_local_setup=bool(req.needs_local_setup))
-    content_b64 = base64.b64encode(json.dumps(bundle_payload, indent=2).encode("utf-8")).decode("utf-8")
+    content_b64 = base64.b64encode(orjson.dumps(bundle_payload, option=orjson.OPT_INDENT_2)).decode("ascii")
 
     # Create the file on the new branch.
-    put_url = f"https://api.github.com/repos/{owner}/{repo}/contents/{urllib.parse.quote(path)}"
+    put_url = f"https://api.github.com/repos/{owner}/{repo}/contents/{qpath}"
     put_body = {
         "message": f"Add {path} for Local Nexus import",
         "content": content_b64,
@@ -968,6 +1592,13 @@ def github_localize_pr(req: GitHubLocalizePrRequest) -> dict:
         raise HTTPException(status_code=400, detail="GitHub returned unexpected repo info.")
     base_branch = str(repo_info.get("default_branch") or ref or "main")
 
+    # Resolve the base ref while run-config detection walks the tree.
+    ref_future = _GITHUB_EXECUTOR.submit(
+        _github_api_request,
+        "GET",
+        f"https://api.github.com/repos/{owner}/{repo}/git/ref/heads/{_quote(base_branch)}",
+        token,
+    )
     cfg = _detect_local_run_config(owner, repo, base_branch, token)
 
     scripts_dir = (req.scripts_dir or "tools/local-nexus").strip().strip("/").strip()
@@ -977,7 +1608,7 @@ def github_localize_pr(req: GitHubLocalizePrRequest) -> dict:
     branch_name = f"local-nexus/localize-{repo}".replace("..", ".")
 
     # Create a new branch from base.
-    ref_info = _github_api_request("GET", f"https://api.github.com/repos/{owner}/{repo}/git/ref/heads/{urllib.parse.quote(base_branch)}", token)
+    ref_info = ref_future.result()
     if not isinstance(ref_info, dict) or "object" not in ref_info:
         raise HTTPException(status_code=400, detail="Could not resolve base branch SHA.")
     base_sha = str((ref_info.get("object") or {}).get("sha") or "")
@@ -996,29 +1627,44 @@ def github_localize_pr(req: GitHubLocalizePrRequest) -> dict:
 
     warnings: list[str] = []
 
+    # Probe the scripts and the bundle on the branch concurrently. The bundle is
+    # probed after the script writes if it shares a path with one of them.
+    meta_futures = {
+        pth: _GITHUB_EXECUTOR.submit(_github_get_contents_meta, owner, repo, pth, branch_name, token)
+        for pth in (start_ps1_path, stop_ps1_path)
+    }
+    bundle_meta_future = (
+        _GITHUB_EXECUTOR.submit(_github_get_contents_meta, owner, repo, bundle_path, branch_name, token)
+        if bundle_path not in meta_futures
+        else None
+    )
+
     # Write start/stop scripts (skip if already exist).
     for pth, content, msg in [
         (start_ps1_path, _generate_local_nexus_start_ps1(cfg), f"Add {start_ps1_path}"),
         (stop_ps1_path, _generate_local_nexus_stop_ps1(cfg), f"Add {stop_ps1_path}"),
     ]:
-        meta = _github_get_contents_meta(owner, repo, pth, branch_name, token)
+        meta = meta_futures[pth].result()
         if meta and meta.get("sha"):
             warnings.append(f"Skipped existing file: {pth}")
             continue
         _github_put_file(owner, repo, pth, branch_name, msg, content, token)
 
     # Create or update bundle
-    bundle_meta = _github_get_contents_meta(owner, repo, bundle_path, branch_name, token)
+    if bundle_meta_future is not None:
+        bundle_meta = bundle_meta_future.result()
+    else:
+        bundle_meta = _github_get_contents_meta(owner, repo, bundle_path, branch_name, token)
     bundle_existing_text = None
     bundle_existing_sha = None
     if bundle_meta and bundle_meta.get("sha"):
         bundle_existing_sha = str(bundle_meta.get("sha"))
-        bundle_existing_text = _github_get_file_text(owner, repo, bundle_path, branch_name, token)
+        bundle_existing_text = _contents_meta_text(bundle_meta)
 
     bundle_payload: dict
     if bundle_existing_text:
         try:
-            bundle_payload = json.loads(bundle_existing_text)
+            bundle_payload = orjson.loads(bundle_existing_text)
             if not isinstance(bundle_payload, dict):
                 raise ValueError("Bundle is not a JSON object")
         except Exception as e:  # noqa: BLE001
@@ -1041,13 +1687,9 @@ def github_localize_pr(req: GitHubLocalizePrRequest) -> dict:
         if not isinstance(tech, list):
             tech = []
         detected = cfg.get("detected") or []
-        if isinstance(detected, list):
-            for t in detected:
-                if t not in tech:
-                    tech.append(t)
-        if "git" not in tech:
-            tech.append("git")
-        svc["tech_stack"] = tech
+        if not isinstance(detected, list):
+            detected = []
+        svc["tech_stack"] = list(dict.fromkeys([*tech, *detected, "git"]))
         bundle_payload["service"] = svc
 
     meta = bundle_payload.get("meta") if isinstance(bundle_payload.get("meta"), dict) else {}
@@ -1064,17 +1706,20 @@ def github_localize_pr(req: GitHubLocalizePrRequest) -> dict:
     )
     bundle_payload["meta"] = meta
 
-    bundle_text = json.dumps(bundle_payload, indent=2) + "\n"
-    _github_put_file(
-        owner,
-        repo,
-        bundle_path,
-        branch_name,
-        f"Add/update {bundle_path} for Local Nexus local runs",
-        bundle_text,
-        token,
-        sha=bundle_existing_sha,
-    )
+    bundle_text = orjson.dumps(bundle_payload, option=_JSON_FILE_OPTIONS)
+    if bundle_existing_sha and _git_blob_sha(bundle_text) == bundle_existing_sha:
+        warnings.append("Bundle unchanged; skipping PUT")
+    else:
+        _github_put_file(
+            owner,
+            repo,
+            bundle_path,
+            branch_name,
+            f"Add/update {bundle_path} for Local Nexus local runs",
+            bundle_text,
+            token,
+            sha=bundle_existing_sha,
+        )
 
     pr_body = (
         "Adds/updates Local Nexus files to run this repo locally.\n\n"
@@ -1107,6 +1752,39 @@ def github_localize_pr(req: GitHubLocalizePrRequest) -> dict:
     }
 
 
+# Fields shared by every per-app bundle the merge flow generates. Each app's
+# bundle shallow-merges its own values over this; the shared nested values
+# are only serialized, never mutated.
+_MERGE_APP_BUNDLE_TEMPLATE: dict[str, Any] = {
+    "service": {
+        "name": "",
+        "description": "",
+        "category": "apps",
+        "tags": ["app", "monorepo"],
+        "tech_stack": ["git", "powershell"],
+        "dependencies": [],
+        "config_paths": [],
+        "port": None,
+        "local_url": None,
+        "healthcheck_url": None,
+        "working_directory": "",
+        "start_command": "",
+        "stop_command": "",
+        "restart_command": "",
+        "env_overrides": {},
+        "database_id": None,
+        "database_connection_string": None,
+        "database_schema_overview": None,
+    },
+    "database": None,
+    "keys": [],
+    "requested_port": None,
+    "auto_assign_port": False,
+    "auto_create_db": False,
+    "meta": {},
+}
+
+
 @router.post("/github-merge-repos-pr", dependencies=[Depends(require_token)])
 def github_merge_repos_pr(req: GitHubMergeReposPrRequest) -> dict:
     token = (req.github_token or "").strip()
@@ -1118,6 +1796,9 @@ def github_merge_repos_pr(req: GitHubMergeReposPrRequest) -> dict:
     src_full = f"{src_owner}/{src_repo}"
     dst_full = f"{dst_owner}/{dst_repo}"
 
+    # The source tree walk is independent of everything on the destination side.
+    src_tree_future = _GITHUB_EXECUTOR.submit(_github_get_tree, src_owner, src_repo, src_ref, token)
+
     dst_info = _github_api_request("GET", f"https://api.github.com/repos/{dst_owner}/{dst_repo}", token)
     if not isinstance(dst_info, dict):
         raise HTTPException(status_code=400, detail="GitHub returned unexpected destination repo info.")
@@ -1133,19 +1814,8 @@ def github_merge_repos_pr(req: GitHubMergeReposPrRequest) -> dict:
     max_files = max(1, min(int(req.max_files or 250), 2000))
     max_total_bytes = max(100_000, min(int(req.max_total_bytes or 15_000_000), 200_000_000))
 
-    base_ref = _github_api_request("GET", f"https://api.github.com/repos/{dst_owner}/{dst_repo}/git/ref/heads/{urllib.parse.quote(base_branch)}", token)
-    if not isinstance(base_ref, dict) or "object" not in base_ref:
-        raise HTTPException(status_code=400, detail="Could not resolve destination base branch SHA.")
-    base_sha = str((base_ref.get("object") or {}).get("sha") or "")
-    if not base_sha:
-        raise HTTPException(status_code=400, detail="Could not resolve destination base branch SHA.")
-
-    base_commit = _github_api_request("GET", f"https://api.github.com/repos/{dst_owner}/{dst_repo}/git/commits/{urllib.parse.quote(base_sha)}", token)
-    if not isinstance(base_commit, dict):
-        raise HTTPException(status_code=400, detail="Could not fetch destination base commit.")
-    base_tree_sha = str(((base_commit.get("tree") or {}) if isinstance(base_commit.get("tree"), dict) else {}).get("sha") or "")
-    if not base_tree_sha:
-        raise HTTPException(status_code=400, detail="Could not resolve destination base tree SHA.")
+    # One walk gives the base commit, its tree, and the destination's existing paths.
+    base_sha, base_tree_sha, dst_base_entries = _github_get_tree(dst_owner, dst_repo, base_branch, token)
 
     branch_name = f"local-nexus/merge-{src_repo}-into-{dst_repo}".replace("..", ".")
     try:
@@ -1158,49 +1828,76 @@ def github_merge_repos_pr(req: GitHubMergeReposPrRequest) -> dict:
     except HTTPException:
         pass
 
-    entries = _github_get_tree_entries(src_owner, src_repo, src_ref, token)
+    _, _, entries = src_tree_future.result()
     blobs = [e for e in entries if e.get("type") == "blob" and e.get("path") and e.get("sha")]
     if not blobs:
         raise HTTPException(status_code=400, detail="No files found in source repo at that ref.")
 
     # Destination base paths (used to avoid overwriting common helper files we generate).
-    dst_base_entries = _github_get_tree_entries(dst_owner, dst_repo, base_branch, token)
-    dst_existing_paths = {str(e.get("path")) for e in dst_base_entries if e.get("type") == "blob" and e.get("path")}
+    dst_existing_paths = set(_tree_blob_paths(dst_base_entries))
 
     total_bytes = 0
     tree_items: list[dict[str, Any]] = []
+    # Destination paths plus everything added to tree_items: one probe answers
+    # "exists already or added by this merge?".
+    known_paths = set(dst_existing_paths)
     warnings: list[str] = []
     created_files = 0
 
+    def add_tree_blob(path: str, sha: str) -> None:
+        tree_items.append({"path": path, "mode": "100644", "type": "blob", "sha": sha})
+        known_paths.add(path)
+
+    def add_text_blobs(files: list[tuple[str, str | bytes]]) -> None:
+        # Create the blobs concurrently, then add them to the tree in order.
+        shas = _GITHUB_EXECUTOR.map(lambda f: _github_create_text_blob(dst_owner, dst_repo, f[1], token), files)
+        for (path, _), sha in zip(files, shas):
+            add_tree_blob(path, sha)
+
+    # The tree listing carries blob sizes, so files past either limit are cut
+    # here and never fetched.
+    copy_candidates: list[dict] = []
+    planned_bytes = 0
+    limit_warning: str | None = None
     for e in blobs:
+        path = str(e.get("path") or "")
+        if not path or path.startswith(".git/"):
+            continue
+        if len(copy_candidates) >= max_files:
+            limit_warning = f"Reached max_files={max_files}; remaining files not copied."
+            break
+        planned_bytes += int(e.get("size") or 0)
+        if planned_bytes > max_total_bytes:
+            limit_warning = f"Reached max_total_bytes={max_total_bytes}; remaining files not copied."
+            break
+        copy_candidates.append(e)
+
+    # Blobs are read and re-created in parallel batches; the budget accounting
+    # below still walks the results in source order.
+    copied = _iter_copied_blobs(src_owner, src_repo, dst_owner, dst_repo, copy_candidates, token)
+    for e, (size, dest_blob_sha, skip_reason) in copied:
         if created_files >= max_files:
-            warnings.append(f"Reached max_files={max_files}; remaining files not copied.")
+            limit_warning = f"Reached max_files={max_files}; remaining files not copied."
             break
 
         src_path = str(e.get("path") or "")
-        if not src_path or src_path.startswith(".git/"):
-            continue
-
-        src_sha = str(e.get("sha") or "")
-        blob = _github_get_blob(src_owner, src_repo, src_sha, token)
-        if bool(blob.get("truncated")):
+        if skip_reason == "truncated":
             warnings.append(f"Skipped large file (truncated by GitHub API): {src_path}")
             continue
-        size = int(blob.get("size") or 0)
         if total_bytes + size > max_total_bytes:
-            warnings.append(f"Reached max_total_bytes={max_total_bytes}; remaining files not copied.")
+            limit_warning = f"Reached max_total_bytes={max_total_bytes}; remaining files not copied."
             break
 
-        if str(blob.get("encoding") or "base64") != "base64":
+        if skip_reason == "encoding":
             warnings.append(f"Skipped file with unknown encoding: {src_path}")
             continue
 
-        content_b64 = str(blob.get("content") or "")
-        dest_blob_sha = _github_create_blob(dst_owner, dst_repo, content_b64, token)
         dest_path = f"{subdir}/{src_path}".replace("//", "/")
-        tree_items.append({"path": dest_path, "mode": "100644", "type": "blob", "sha": dest_blob_sha})
+        add_tree_blob(dest_path, dest_blob_sha)
         total_bytes += size
         created_files += 1
+    if limit_warning:
+        warnings.append(limit_warning)
 
     # Add Local Nexus scripts for the merged app (best-effort) if not already present.
     try:
@@ -1208,17 +1905,17 @@ def github_merge_repos_pr(req: GitHubMergeReposPrRequest) -> dict:
         app_start_rel = f"{subdir}/tools/local-nexus/start.ps1"
         app_stop_rel = f"{subdir}/tools/local-nexus/stop.ps1"
 
-        for rel_path, content_text, label in [
-            (app_start_rel, _generate_local_nexus_start_ps1(cfg), "Add app start script"),
-            (app_stop_rel, _generate_local_nexus_stop_ps1(cfg), "Add app stop script"),
+        app_scripts: list[tuple[str, str | bytes]] = []
+        for rel_path, content_text in [
+            (app_start_rel, _generate_local_nexus_start_ps1(cfg)),
+            (app_stop_rel, _generate_local_nexus_stop_ps1(cfg)),
         ]:
             # If the source repo already contained these paths, they were copied above; don't overwrite.
-            if any(t.get("path") == rel_path for t in tree_items) or rel_path in dst_existing_paths:
+            if rel_path in known_paths:
                 warnings.append(f"Skipped generating (already exists): {rel_path}")
                 continue
-            b64 = base64.b64encode(content_text.encode("utf-8")).decode("utf-8")
-            sha = _github_create_blob(dst_owner, dst_repo, b64, token)
-            tree_items.append({"path": rel_path, "mode": "100644", "type": "blob", "sha": sha})
+            app_scripts.append((rel_path, content_text))
+        add_text_blobs(app_scripts)
     except Exception as e:  # noqa: BLE001
         warnings.append(f"Local Nexus app scripts not generated: {e}")
 
@@ -1232,191 +1929,31 @@ def github_merge_repos_pr(req: GitHubMergeReposPrRequest) -> dict:
     master_port_check = f"{master_scripts_dir}/check-ports.ps1"
     master_bundle_path = "local-nexus.apps.bundle.json"
 
+    # Generated files are queued and their blobs created together before the tree is built.
+    generated: list[tuple[str, str | bytes]] = []
+
     dest_has_root_start = "tools/local-nexus/start.ps1" in dst_existing_paths
     dest_has_root_stop = "tools/local-nexus/stop.ps1" in dst_existing_paths
 
-    master_start_lines: list[str] = []
-    master_start_lines.append('$ErrorActionPreference = "Stop"')
-    master_start_lines.append("")
-    master_start_lines.append("# Auto-generated by Local Nexus Controller")
-    master_start_lines.append("# Starts the 'master program' (destination root + every app under apps/*).")
-    master_start_lines.append("")
-    master_start_lines.append('$repoRoot = (Resolve-Path (Join-Path $PSScriptRoot \"..\\..\" )).Path')
-    master_start_lines.append("Set-Location $repoRoot")
-    master_start_lines.append("")
-    if dest_has_root_start:
-        master_start_lines.append('Write-Host \"Starting destination root service...\"')
-        master_start_lines.append('powershell -ExecutionPolicy Bypass -File \"tools\\local-nexus\\start.ps1\"')
-        master_start_lines.append("")
-    master_start_lines.append('Write-Host \"Starting apps/* ...\"')
-    master_start_lines.append('$appsRoot = Join-Path $repoRoot "apps"')
-    master_start_lines.append('if (!(Test-Path $appsRoot)) { Write-Host "No apps/ folder found."; exit 0 }')
-    master_start_lines.append('$apps = Get-ChildItem -Path $appsRoot -Directory -ErrorAction SilentlyContinue')
-    master_start_lines.append("foreach ($app in $apps) {")
-    master_start_lines.append('  $appRoot = $app.FullName')
-    master_start_lines.append('  $rel = Join-Path "apps" $app.Name')
-    master_start_lines.append('  $startScript = Join-Path $appRoot "tools\\local-nexus\\start.ps1"')
-    master_start_lines.append("  if (Test-Path $startScript) {")
-    master_start_lines.append('    Write-Host ("Starting " + $rel)')
-    master_start_lines.append('    powershell -ExecutionPolicy Bypass -File $startScript')
-    master_start_lines.append("    continue")
-    master_start_lines.append("  }")
-    master_start_lines.append("  # Fallback: if the app has a compose file, start it with an isolated project name.")
-    master_start_lines.append('  $composeCandidates = @("docker-compose.yml","docker-compose.yaml","compose.yml","compose.yaml")')
-    master_start_lines.append('  $compose = $composeCandidates | ForEach-Object { Join-Path $appRoot $_ } | Where-Object { Test-Path $_ } | Select-Object -First 1')
-    master_start_lines.append("  if ($compose) {")
-    master_start_lines.append('    $project = ("lnc-" + $app.Name).ToLowerInvariant()')
-    master_start_lines.append('    Write-Host ("Starting docker compose for " + $rel + " (project " + $project + ")")')
-    master_start_lines.append('    docker compose -f $compose -p $project up -d')
-    master_start_lines.append("    continue")
-    master_start_lines.append("  }")
-    master_start_lines.append('  Write-Host ("No start script or compose file for " + $rel + ". Run Localize PR for that app.")')
-    master_start_lines.append("}")
-    master_start_text = "\n".join(master_start_lines) + "\n"
-
-    master_stop_lines: list[str] = []
-    master_stop_lines.append('$ErrorActionPreference = "Stop"')
-    master_stop_lines.append("")
-    master_stop_lines.append("# Auto-generated by Local Nexus Controller")
-    master_stop_lines.append("")
-    master_stop_lines.append('$repoRoot = (Resolve-Path (Join-Path $PSScriptRoot \"..\\..\" )).Path')
-    master_stop_lines.append("Set-Location $repoRoot")
-    master_stop_lines.append("")
-    if dest_has_root_stop:
-        master_stop_lines.append('Write-Host \"Stopping destination root service...\"')
-        master_stop_lines.append('powershell -ExecutionPolicy Bypass -File \"tools\\local-nexus\\stop.ps1\"')
-        master_stop_lines.append("")
-    master_stop_lines.append('Write-Host \"Stopping apps/* ...\"')
-    master_stop_lines.append('$appsRoot = Join-Path $repoRoot "apps"')
-    master_stop_lines.append('if (!(Test-Path $appsRoot)) { Write-Host "No apps/ folder found."; exit 0 }')
-    master_stop_lines.append('$apps = Get-ChildItem -Path $appsRoot -Directory -ErrorAction SilentlyContinue')
-    master_stop_lines.append("foreach ($app in $apps) {")
-    master_stop_lines.append('  $appRoot = $app.FullName')
-    master_stop_lines.append('  $rel = Join-Path "apps" $app.Name')
-    master_stop_lines.append('  $stopScript = Join-Path $appRoot "tools\\local-nexus\\stop.ps1"')
-    master_stop_lines.append("  if (Test-Path $stopScript) {")
-    master_stop_lines.append('    Write-Host ("Stopping " + $rel)')
-    master_stop_lines.append('    powershell -ExecutionPolicy Bypass -File $stopScript')
-    master_stop_lines.append("    continue")
-    master_stop_lines.append("  }")
-    master_stop_lines.append('  $composeCandidates = @("docker-compose.yml","docker-compose.yaml","compose.yml","compose.yaml")')
-    master_stop_lines.append('  $compose = $composeCandidates | ForEach-Object { Join-Path $appRoot $_ } | Where-Object { Test-Path $_ } | Select-Object -First 1')
-    master_stop_lines.append("  if ($compose) {")
-    master_stop_lines.append('    $project = ("lnc-" + $app.Name).ToLowerInvariant()')
-    master_stop_lines.append('    Write-Host ("Stopping docker compose for " + $rel + " (project " + $project + ")")')
-    master_stop_lines.append('    docker compose -f $compose -p $project down')
-    master_stop_lines.append("    continue")
-    master_stop_lines.append("  }")
-    master_stop_lines.append('  Write-Host ("No stop script or compose file for " + $rel + ".")')
-    master_stop_lines.append("}")
-    master_stop_text = "\n".join(master_stop_lines) + "\n"
+    master_start_text = _PS1_START_ALL_HEADER + (_PS1_START_ALL_ROOT if dest_has_root_start else "") + _PS1_START_ALL_APPS
+    master_stop_text = _PS1_STOP_ALL_HEADER + (_PS1_STOP_ALL_ROOT if dest_has_root_stop else "") + _PS1_STOP_ALL_APPS
 
     # Root helpers
-    docker_up_lines: list[str] = []
-    docker_up_lines.append('$ErrorActionPreference = "Stop"')
-    docker_up_lines.append("")
-    docker_up_lines.append("# Auto-generated by Local Nexus Controller")
-    docker_up_lines.append("# Starts docker compose for every app under apps/* that has a compose file.")
-    docker_up_lines.append("")
-    docker_up_lines.append('$repoRoot = (Resolve-Path (Join-Path $PSScriptRoot \"..\\..\" )).Path')
-    docker_up_lines.append("Set-Location $repoRoot")
-    docker_up_lines.append('$appsRoot = Join-Path $repoRoot "apps"')
-    docker_up_lines.append('if (!(Test-Path $appsRoot)) { Write-Host "No apps/ folder found."; exit 0 }')
-    docker_up_lines.append('$apps = Get-ChildItem -Path $appsRoot -Directory -ErrorAction SilentlyContinue')
-    docker_up_lines.append('  $composeCandidates = @("docker-compose.yml","docker-compose.yaml","compose.yml","compose.yaml")')
-    docker_up_lines.append("foreach ($app in $apps) {")
-    docker_up_lines.append('  $appRoot = $app.FullName')
-    docker_up_lines.append('  $rel = Join-Path "apps" $app.Name')
-    docker_up_lines.append('  $compose = $composeCandidates | ForEach-Object { Join-Path $appRoot $_ } | Where-Object { Test-Path $_ } | Select-Object -First 1')
-    docker_up_lines.append("  if (!$compose) { continue }")
-    docker_up_lines.append('  $project = ("lnc-" + $app.Name).ToLowerInvariant()')
-    docker_up_lines.append('  Write-Host ("docker compose up: " + $rel + " (project " + $project + ")")')
-    docker_up_lines.append('  docker compose -f $compose -p $project up -d')
-    docker_up_lines.append("}")
-    docker_up_text = "\n".join(docker_up_lines) + "\n"
-
-    docker_down_lines: list[str] = []
-    docker_down_lines.append('$ErrorActionPreference = "Stop"')
-    docker_down_lines.append("")
-    docker_down_lines.append("# Auto-generated by Local Nexus Controller")
-    docker_down_lines.append("# Stops docker compose for every app under apps/* that has a compose file.")
-    docker_down_lines.append("")
-    docker_down_lines.append('$repoRoot = (Resolve-Path (Join-Path $PSScriptRoot \"..\\..\" )).Path')
-    docker_down_lines.append("Set-Location $repoRoot")
-    docker_down_lines.append('$appsRoot = Join-Path $repoRoot "apps"')
-    docker_down_lines.append('if (!(Test-Path $appsRoot)) { Write-Host "No apps/ folder found."; exit 0 }')
-    docker_down_lines.append('$apps = Get-ChildItem -Path $appsRoot -Directory -ErrorAction SilentlyContinue')
-    docker_down_lines.append('  $composeCandidates = @("docker-compose.yml","docker-compose.yaml","compose.yml","compose.yaml")')
-    docker_down_lines.append("foreach ($app in $apps) {")
-    docker_down_lines.append('  $appRoot = $app.FullName')
-    docker_down_lines.append('  $rel = Join-Path "apps" $app.Name')
-    docker_down_lines.append('  $compose = $composeCandidates | ForEach-Object { Join-Path $appRoot $_ } | Where-Object { Test-Path $_ } | Select-Object -First 1')
-    docker_down_lines.append("  if (!$compose) { continue }")
-    docker_down_lines.append('  $project = ("lnc-" + $app.Name).ToLowerInvariant()')
-    docker_down_lines.append('  Write-Host ("docker compose down: " + $rel + " (project " + $project + ")")')
-    docker_down_lines.append('  docker compose -f $compose -p $project down')
-    docker_down_lines.append("}")
-    docker_down_text = "\n".join(docker_down_lines) + "\n"
-
-    env_lines: list[str] = []
-    env_lines.append('$ErrorActionPreference = "Stop"')
-    env_lines.append("")
-    env_lines.append("# Auto-generated by Local Nexus Controller")
-    env_lines.append("# Aggregates .env.example files from root and apps/* into LOCAL_NEXUS.env.example")
-    env_lines.append("")
-    env_lines.append('$repoRoot = (Resolve-Path (Join-Path $PSScriptRoot \"..\\..\" )).Path')
-    env_lines.append("Set-Location $repoRoot")
-    env_lines.append('$outPath = Join-Path $repoRoot "LOCAL_NEXUS.env.example"')
-    env_lines.append('$sb = New-Object System.Text.StringBuilder')
-    env_lines.append('$candidates = New-Object System.Collections.Generic.List[string]')
-    env_lines.append('$rootExample = Join-Path $repoRoot ".env.example"')
-    env_lines.append('if (Test-Path $rootExample) { [void]$candidates.Add($rootExample) }')
-    env_lines.append('$appsRoot = Join-Path $repoRoot "apps"')
-    env_lines.append('if (Test-Path $appsRoot) {')
-    env_lines.append('  Get-ChildItem -Path $appsRoot -Directory -ErrorAction SilentlyContinue | ForEach-Object {')
-    env_lines.append('    $p = Join-Path $_.FullName ".env.example"')
-    env_lines.append('    if (Test-Path $p) { [void]$candidates.Add($p) }')
-    env_lines.append("  }")
-    env_lines.append("}")
-    env_lines.append('foreach ($p in $candidates) {')
-    env_lines.append('  [void]$sb.AppendLine("### " + $p.Replace($repoRoot + "\\", ""))')
-    env_lines.append('  [void]$sb.AppendLine((Get-Content -Raw -Path $p))')
-    env_lines.append('  [void]$sb.AppendLine("")')
-    env_lines.append("}")
-    env_lines.append('Set-Content -Path $outPath -Value $sb.ToString() -Encoding UTF8')
-    env_lines.append('Write-Host ("Wrote: " + $outPath)')
-    env_text = "\n".join(env_lines) + "\n"
-
-    port_lines: list[str] = []
-    port_lines.append('$ErrorActionPreference = "Stop"')
-    port_lines.append("")
-    port_lines.append("# Auto-generated by Local Nexus Controller")
-    port_lines.append("# Simple port visibility helper (Windows).")
-    port_lines.append("")
-    port_lines.append('Write-Host "Listening ports (TCP) - top 50:"')
-    port_lines.append('try {')
-    port_lines.append('  Get-NetTCPConnection -State Listen | Select-Object -First 50 LocalAddress,LocalPort,OwningProcess | Format-Table -AutoSize')
-    port_lines.append('} catch {')
-    port_lines.append('  netstat -ano | Select-String "LISTENING" | Select-Object -First 50')
-    port_lines.append('}')
-    port_lines.append("")
-    port_lines.append('Write-Host "Tip: run the dashboard action Resolve ports to fix reserved port conflicts for registered services."')
-    port_text = "\n".join(port_lines) + "\n"
+    docker_up_text = _PS1_DOCKER_UP
+    docker_down_text = _PS1_DOCKER_DOWN
 
     for rel_path, content_text in [
         (master_start, master_start_text),
         (master_stop, master_stop_text),
         (master_docker_up, docker_up_text),
         (master_docker_down, docker_down_text),
-        (master_env_agg, env_text),
-        (master_port_check, port_text),
+        (master_env_agg, _PS1_ENV_EXAMPLE),
+        (master_port_check, _PS1_CHECK_PORTS),
     ]:
         if rel_path in dst_existing_paths:
             warnings.append(f"Skipped generating (already exists): {rel_path}")
             continue
-        b64 = base64.b64encode(content_text.encode("utf-8")).decode("utf-8")
-        sha = _github_create_blob(dst_owner, dst_repo, b64, token)
-        tree_items.append({"path": rel_path, "mode": "100644", "type": "blob", "sha": sha})
+        generated.append((rel_path, content_text))
 
     if master_bundle_path not in dst_existing_paths:
         master_bundle = {
@@ -1453,48 +1990,36 @@ def github_merge_repos_pr(req: GitHubMergeReposPrRequest) -> dict:
                 "notes": "Import this bundle to control the combined 'master program'. Replace {REPO_ROOT} with your local clone path.",
             },
         }
-        master_bundle_text = json.dumps(master_bundle, indent=2) + "\n"
-        b64 = base64.b64encode(master_bundle_text.encode("utf-8")).decode("utf-8")
-        sha = _github_create_blob(dst_owner, dst_repo, b64, token)
-        tree_items.append({"path": master_bundle_path, "mode": "100644", "type": "blob", "sha": sha})
+        generated.append((master_bundle_path, orjson.dumps(master_bundle, option=_JSON_FILE_OPTIONS)))
     else:
         warnings.append(f"Skipped generating (already exists): {master_bundle_path}")
 
     # Generate one bundle per app under apps/* (skip if already present).
     # We infer app names from existing destination tree + newly added merge paths.
     app_names: set[str] = set()
-    for p in list(dst_existing_paths) + [str(t.get("path") or "") for t in tree_items]:
+    for p in known_paths:
         if not p.startswith("apps/"):
             continue
         parts = p.split("/")
         if len(parts) >= 2 and parts[1]:
             app_names.add(parts[1])
 
-    # Helper to check if a path is in the new tree.
-    new_paths = {str(t.get("path") or "") for t in tree_items if t.get("path")}
-
     for app in sorted(app_names):
         app_bundle_path = f"apps/{app}/local-nexus.bundle.json"
-        if app_bundle_path in dst_existing_paths or app_bundle_path in new_paths:
+        if app_bundle_path in known_paths:
             continue
 
         app_start = f"apps/{app}/tools/local-nexus/start.ps1"
         app_stop = f"apps/{app}/tools/local-nexus/stop.ps1"
-        has_start = (app_start in dst_existing_paths) or (app_start in new_paths)
-        has_stop = (app_stop in dst_existing_paths) or (app_stop in new_paths)
+        has_start = app_start in known_paths
+        has_stop = app_stop in known_paths
 
         app_bundle = {
+            **_MERGE_APP_BUNDLE_TEMPLATE,
             "service": {
+                **_MERGE_APP_BUNDLE_TEMPLATE["service"],
                 "name": app,
                 "description": f"App {app} inside {dst_full}",
-                "category": "apps",
-                "tags": ["app", "monorepo"],
-                "tech_stack": ["git", "powershell"],
-                "dependencies": [],
-                "config_paths": [],
-                "port": None,
-                "local_url": None,
-                "healthcheck_url": None,
                 "working_directory": f"{{REPO_ROOT}}\\\\apps\\\\{app}",
                 "start_command": (
                     f"powershell -ExecutionPolicy Bypass -File apps\\\\{app}\\\\tools\\\\local-nexus\\\\start.ps1"
@@ -1506,17 +2031,7 @@ def github_merge_repos_pr(req: GitHubMergeReposPrRequest) -> dict:
                     if has_stop
                     else ""
                 ),
-                "restart_command": "",
-                "env_overrides": {},
-                "database_id": None,
-                "database_connection_string": None,
-                "database_schema_overview": None,
             },
-            "database": None,
-            "keys": [],
-            "requested_port": None,
-            "auto_assign_port": False,
-            "auto_create_db": False,
             "meta": {
                 "source": "github-merge",
                 "destination": dst_full,
@@ -1525,10 +2040,7 @@ def github_merge_repos_pr(req: GitHubMergeReposPrRequest) -> dict:
                 "notes": "Import this bundle to control a single app. Replace {REPO_ROOT} with your local clone path.",
             },
         }
-        app_bundle_text = json.dumps(app_bundle, indent=2) + "\n"
-        b64 = base64.b64encode(app_bundle_text.encode("utf-8")).decode("utf-8")
-        sha = _github_create_blob(dst_owner, dst_repo, b64, token)
-        tree_items.append({"path": app_bundle_path, "mode": "100644", "type": "blob", "sha": sha})
+        generated.append((app_bundle_path, orjson.dumps(app_bundle, option=_JSON_FILE_OPTIONS)))
 
     manifest = {
         "source": src_full,
@@ -1539,10 +2051,8 @@ def github_merge_repos_pr(req: GitHubMergeReposPrRequest) -> dict:
         "total_bytes": total_bytes,
         "notes": "Copied via Local Nexus Controller (no git history).",
     }
-    manifest_text = json.dumps(manifest, indent=2) + "\n"
-    manifest_b64 = base64.b64encode(manifest_text.encode("utf-8")).decode("utf-8")
-    manifest_blob_sha = _github_create_blob(dst_owner, dst_repo, manifest_b64, token)
-    tree_items.append({"path": f"{subdir}/LOCAL_NEXUS_MERGE_MANIFEST.json", "mode": "100644", "type": "blob", "sha": manifest_blob_sha})
+    generated.append((f"{subdir}/LOCAL_NEXUS_MERGE_MANIFEST.json", orjson.dumps(manifest, option=_JSON_FILE_OPTIONS)))
+    add_text_blobs(generated)
 
     new_tree_sha = _github_create_tree(dst_owner, dst_repo, base_tree_sha, tree_items, token)
     commit_sha = _github_create_commit(
@@ -1604,8 +2114,15 @@ def github_workspace_prepare(req: GitHubWorkspacePrepareRequest) -> dict:
 
     if not ws_dir.exists():
         ws_dir.mkdir(parents=True, exist_ok=True)
-        # Clone default branch shallow-ish, then fetch the PR branch.
-        code, out = _run_git(["clone", repo_url, "."], cwd=ws_dir, token=token, timeout_s=600)
+        # Partial clone of the default branch only: commits and trees come down
+        # now, file contents only when a checkout needs them. The PR branch is
+        # fetched below.
+        code, out = _run_git(
+            ["clone", "--filter=blob:none", "--single-branch", repo_url, "."],
+            cwd=ws_dir,
+            token=token,
+            timeout_s=600,
+        )
         if code != 0:
             raise HTTPException(status_code=400, detail=f"git clone failed: {out}")
     else:
@@ -1614,7 +2131,9 @@ def github_workspace_prepare(req: GitHubWorkspacePrepareRequest) -> dict:
             raise HTTPException(status_code=400, detail=f"Workspace exists but is not a git repo: {out}")
 
     # Ensure branch exists locally and is up to date.
-    _run_git(["fetch", "origin", branch], cwd=ws_dir, token=token, timeout_s=600)
+    # Explicit refspec: a single-branch clone's fetch config only maps the
+    # default branch, so "fetch origin <branch>" would not create origin/<branch>.
+    _run_git(["fetch", "origin", f"+refs/heads/{branch}:refs/remotes/origin/{branch}"], cwd=ws_dir, token=token, timeout_s=600)
     code, out = _run_git(["checkout", branch], cwd=ws_dir, token=token)
     if code != 0:
         # Create local branch tracking origin/branch
@@ -1641,6 +2160,8 @@ def github_workspace_open(req: GitHubWorkspaceOpenRequest) -> dict:
 
     cursor_cmd = _find_cursor_command()
     if not cursor_cmd:
+        # Don't remember the miss, so installing Cursor doesn't need a restart.
+        _find_cursor_command.cache_clear()
         raise HTTPException(status_code=400, detail="Cursor not found. Install Cursor or ensure 'cursor' is on PATH.")
 
     try:
@@ -1700,8 +2221,8 @@ def github_list_bundles(req: GitHubListBundlesRequest) -> dict:
         raise HTTPException(status_code=400, detail="GitHub token required. Click 'GitHub token' and paste one.")
 
     owner, repo, ref, _ = _parse_github_input(req.repo, req.ref, "x")
-    entries = _github_get_tree_entries(owner, repo, ref, token)
-    paths = sorted({str(e.get("path")) for e in entries if e.get("type") == "blob" and e.get("path")})
+    _, _, entries = _github_get_tree(owner, repo, ref, token)
+    paths = sorted(set(_tree_blob_paths(entries)))
 
     bundles: list[dict[str, Any]] = []
     for p in paths:
@@ -1747,62 +2268,126 @@ def github_device_poll(req: GitHubDevicePollRequest) -> dict:
 
     return {"status": "unknown", "raw": payload}
 
+_SCAN_IMPORT_BATCH = 100
+
+
+def _import_bundle_batch(session: Session, items: list[tuple[str, str, ImportBundle]]) -> tuple[list[dict], list[dict]]:
+    """
+    Import (result type, path, bundle) items in one transaction; returns
+    (results, errors). If any bundle fails, the batch is rolled back and
+    retried one commit per bundle so the others still land.
+    """
+
+    def result(kind: str, path: str, bundle: ImportBundle, res: Any) -> dict:
+        return {
+            "type": kind,
+            "path": path,
+            "service_name": bundle.service.name,
+            "service_id": res.service_id,
+            "database_id": res.database_id,
+            "warnings": res.warnings,
+        }
+
+    try:
+        results = [result(kind, path, b, import_bundle_impl(session, b, commit=False)) for kind, path, b in items]
+        session.commit()
+        return results, []
+    except Exception:  # noqa: BLE001 - fall back to per-bundle imports below
+        session.rollback()
+    finally:
+        invalidate_service_index()
+
+    results, errors = [], []
+    for kind, path, b in items:
+        try:
+            results.append(result(kind, path, b, import_bundle_impl(session, b)))
+        except Exception as e:  # noqa: BLE001 - continue importing other bundles
+            session.rollback()
+            errors.append({"path": path, "service_name": b.service.name, "error": str(e)})
+    return results, errors
+
+
+def _find_bundles_and_repos(root: Path, bundle_filename: str, max_files: int, max_repos: int) -> tuple[list[Path], list[Path]]:
+    """
+    One walk of root for (bundle files, git repo roots without a bundle).
+
+    Dependency/build folders (SKIP_FOLDERS) are not descended into, symlinks
+    are not followed, and the walk stops once both caps are reached.
+    """
+    bundle_paths: list[Path] = []
+    repo_roots: list[Path] = []
+    stack = [str(root)]
+    while stack and (len(bundle_paths) < max_files or len(repo_roots) < max_repos):
+        folder = stack.pop()
+        has_bundle = has_git = False
+        subdirs: list[str] = []
+        try:
+            with os.scandir(folder) as it:
+                for entry in it:
+                    try:
+                        if entry.name == bundle_filename and entry.is_file():
+                            has_bundle = len(bundle_paths) < max_files
+                        elif entry.is_dir(follow_symlinks=False):
+                            if entry.name == ".git":
+                                has_git = True
+                            elif entry.name not in SKIP_FOLDERS:
+                                subdirs.append(entry.path)
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+        if has_bundle:
+            bundle_paths.append(Path(folder) / bundle_filename)
+        elif has_git and len(repo_roots) < max_repos:
+            repo_roots.append(Path(folder).resolve())
+        # Sorted so the caps cut off the same folders on every run.
+        stack.extend(sorted(subdirs, reverse=True))
+    return bundle_paths, repo_roots
+
+
+# Bundle files are read and validated on a few threads; file reads release the GIL.
+_BUNDLE_READ_WORKERS = 8
+
+
+def _load_bundle_file(p: Path) -> ImportBundle | str:
+    """Parse and validate one bundle file, or return the error text for the UI."""
+    try:
+        return ImportBundle.model_validate(orjson.loads(p.read_bytes()))  # type: ignore[attr-defined]
+    except Exception as e:  # noqa: BLE001 - return readable error to UI
+        return str(e)
+
+
 @router.post("/scan-bundles", dependencies=[Depends(require_token)])
 def scan_and_import_bundles(req: ScanBundlesRequest, session: Session = Depends(get_session)) -> dict:
     root = Path(req.root).expanduser()
     if not root.exists() or not root.is_dir():
         raise HTTPException(status_code=400, detail=f"Folder not found: {root}")
 
-    bundle_paths: list[Path] = []
-    for p in root.rglob(req.bundle_filename):
-        if p.is_file():
-            bundle_paths.append(p)
-        if len(bundle_paths) >= int(req.max_files):
-            break
-
-    roots_with_bundle = {p.parent.resolve() for p in bundle_paths}
-
-    repo_roots: list[Path] = []
-    if req.include_git_repos:
-        for git_dir in root.rglob(".git"):
-            if not git_dir.is_dir():
-                continue
-            repo_root = git_dir.parent.resolve()
-            if repo_root in roots_with_bundle:
-                continue
-            repo_roots.append(repo_root)
-            if len(repo_roots) >= int(req.max_repos):
-                break
+    bundle_paths, repo_roots = _find_bundles_and_repos(
+        root,
+        req.bundle_filename,
+        int(req.max_files),
+        int(req.max_repos) if req.include_git_repos else 0,
+    )
 
     results: list[dict] = []
     errors: list[dict] = []
+    to_import: list[tuple[str, str, ImportBundle]] = []  # (result type, path, bundle)
 
-    for p in bundle_paths:
-        try:
-            payload = json.loads(p.read_text(encoding="utf-8"))
-            bundle = ImportBundle.model_validate(payload)  # type: ignore[attr-defined]
-        except Exception as e:  # noqa: BLE001 - return readable error to UI
-            errors.append({"path": str(p), "error": str(e)})
+    loaded: list[ImportBundle | str] = []
+    if bundle_paths:
+        with ThreadPoolExecutor(max_workers=min(_BUNDLE_READ_WORKERS, len(bundle_paths))) as executor:
+            loaded = list(executor.map(_load_bundle_file, bundle_paths))
+
+    for p, bundle in zip(bundle_paths, loaded):
+        if isinstance(bundle, str):
+            errors.append({"path": str(p), "error": bundle})
             continue
 
         if req.dry_run:
             results.append({"type": "bundle", "path": str(p), "service_name": bundle.service.name})
             continue
-
-        try:
-            res = import_bundle_impl(session, bundle)
-            results.append(
-                {
-                    "type": "bundle",
-                    "path": str(p),
-                    "service_name": bundle.service.name,
-                    "service_id": res.service_id,
-                    "database_id": res.database_id,
-                    "warnings": res.warnings,
-                }
-            )
-        except Exception as e:  # noqa: BLE001 - continue importing other bundles
-            errors.append({"path": str(p), "service_name": bundle.service.name, "error": str(e)})
+        to_import.append(("bundle", str(p), bundle))
 
     for repo_root in repo_roots:
         repo_name = repo_root.name
@@ -1838,21 +2423,12 @@ def scan_and_import_bundles(req: ScanBundlesRequest, session: Session = Depends(
         if req.dry_run:
             results.append({"type": "git-repo", "path": str(repo_root), "service_name": repo_name})
             continue
+        to_import.append(("git-repo", str(repo_root), bundle))
 
-        try:
-            res = import_bundle_impl(session, bundle)
-            results.append(
-                {
-                    "type": "git-repo",
-                    "path": str(repo_root),
-                    "service_name": repo_name,
-                    "service_id": res.service_id,
-                    "database_id": res.database_id,
-                    "warnings": res.warnings,
-                }
-            )
-        except Exception as e:  # noqa: BLE001 - continue importing other repos
-            errors.append({"path": str(repo_root), "service_name": repo_name, "error": str(e)})
+    for i in range(0, len(to_import), _SCAN_IMPORT_BATCH):
+        imported, failed = _import_bundle_batch(session, to_import[i : i + _SCAN_IMPORT_BATCH])
+        results.extend(imported)
+        errors.extend(failed)
 
     return {
         "root": str(root),
@@ -1866,9 +2442,9 @@ def scan_and_import_bundles(req: ScanBundlesRequest, session: Session = Depends(
     }
 
 
-@router.get("/bundle-template")
-def bundle_template() -> dict:
-    return {
+# Constant payload: serialize once at import instead of on every request.
+_BUNDLE_TEMPLATE_JSON = orjson.dumps(
+    {
         "service": {
             "name": "My New Local Service",
             "description": "What it does / why it exists",
@@ -1913,33 +2489,46 @@ def bundle_template() -> dict:
             "notes": "Paste into dashboard Import"
         },
     }
+)
+
+
+@router.get("/bundle-template")
+async def bundle_template() -> Response:
+    return Response(content=_BUNDLE_TEMPLATE_JSON, media_type="application/json")
+
+
+# Services without keys are skipped, so an inner join already yields the
+# rows grouped and sorted the way the listing needs them.
+_SELECT_ENV_EXAMPLE_ROWS = (
+    select(Service.id, Service.name, KeyRef.env_var, KeyRef.key_name, KeyRef.description)
+    .join(KeyRef, KeyRef.service_id == Service.id)
+    .order_by(Service.name, Service.id, KeyRef.env_var)
+)
 
 
 @router.get("/env-example")
-def env_example(session: Session = Depends(get_session)) -> dict:
+async def env_example() -> dict:
     """
     Generates a combined .env.example style listing of *references* (never values).
     """
 
-    services = list(session.exec(select(Service).order_by(Service.name)))
-    keys = list(session.exec(select(KeyRef).order_by(KeyRef.env_var)))
-    keys_by_service: dict[str, list[KeyRef]] = {}
-    for k in keys:
-        keys_by_service.setdefault(k.service_id, []).append(k)
+    return await asyncio.to_thread(_env_example)
+
+
+def _env_example() -> dict:
+    with Session(engine) as session:
+        rows = session.exec(_SELECT_ENV_EXAMPLE_ROWS).all()
 
     lines: list[str] = []
     lines.append("# Local Nexus Controller - referenced keys (example)")
     lines.append("# NOTE: This file contains references only. Do not put real secrets in source control.")
     lines.append("")
 
-    for svc in services:
-        svc_keys = keys_by_service.get(svc.id, [])
-        if not svc_keys:
-            continue
-        lines.append(f"### {svc.name}")
-        for k in svc_keys:
-            comment = f" # {k.key_name}" + (f" ({k.description})" if k.description else "")
-            lines.append(f"{k.env_var}={comment}")
+    for (_, svc_name), svc_keys in groupby(rows, key=lambda r: (r[0], r[1])):
+        lines.append(f"### {svc_name}")
+        for _, _, env_var, key_name, description in svc_keys:
+            comment = f" # {key_name}" + (f" ({description})" if description else "")
+            lines.append(f"{env_var}={comment}")
         lines.append("")
 
     return {"env_example": "\n".join(lines).rstrip() + "\n"}
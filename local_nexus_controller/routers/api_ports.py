@@ -7,6 +7,7 @@ from local_nexus_controller.db import get_session
 from local_nexus_controller.models import Service
 from local_nexus_controller.security import require_token
 from local_nexus_controller.services.ports import is_port_in_use, next_available_port, port_map
+from local_nexus_controller.services.service_index import invalidate_service_index
 
 
 router = APIRouter()
@@ -124,6 +125,8 @@ def resolve_conflicts(
             )
 
     session.commit()
+    if changes:
+        invalidate_service_index()
 
     # 3) Update dependent Vite apps: VITE_API_BASE_URL -> dependency local_url
     services = list(session.exec(select(Service).order_by(Service.name)))
@@ -10,6 +10,7 @@ from local_nexus_controller.models import KeyRef, Service, ServiceCreate, Servic
 from local_nexus_controller.security import require_token
 from local_nexus_controller.services.logs import tail_text_file
 from local_nexus_controller.services.process_manager import refresh_status, restart_service, start_service, stop_service
+from local_nexus_controller.services.service_index import invalidate_service_index
 
 
 router = APIRouter()
@@ -50,6 +51,7 @@ def create_service(service_in: ServiceCreate, session: Session = Depends(get_ses
     session.add(svc)
     session.commit()
     session.refresh(svc)
+    invalidate_service_index()
     return svc
 
 
@@ -77,6 +79,8 @@ def update_service(service_id: str, patch: ServiceUpdate, session: Session = Dep
     session.add(svc)
     session.commit()
     session.refresh(svc)
+    if "port" in data or "name" in data:
+        invalidate_service_index()
     return svc
 
 
@@ -92,6 +96,7 @@ def delete_service(service_id: str, session: Session = Depends(get_session)) ->
         session.delete(k)
     session.delete(svc)
     session.commit()
+    invalidate_service_index()
     return {"ok": True}
 
 
@@ -5,12 +5,20 @@ from __future__ import annotations
 
 import json
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 
 from local_nexus_controller.models import ImportBundle, ServiceCreate, DatabaseCreate, KeyRefCreate
 
 
+# Directory names that never contain a top-level program worth importing.
+SKIP_FOLDERS = frozenset({"node_modules", ".git", "__pycache__", "venv", ".venv", "dist", "build"})
+
+# Repository inspection is stat/readdir bound, so a few threads overlap it well.
+_SCAN_WORKERS = 8
+
+
 def detect_program_type(repo_path: Path) -> Optional[str]:
     """Detect the type of program in a repository with error handling."""
     try:
@@ -116,16 +124,48 @@ def scan_repository_folder(folder_path: str, existing_ports: set[int]) -> list[I
     Returns:
         List of ImportBundle objects for discovered programs
     """
-    bundles = []
+    return list(iter_repository_folder(folder_path, existing_ports))
+
+
+def _inspect_repo(repo_path: Path) -> Optional[tuple[Path, str, dict, str]]:
+    """
+    Filesystem half of discovery for one directory: detect the program type
+    (looking one level down if needed) and read its metadata.
+
+    Returns (program_path, program_type, info, start_command), or None.
+    """
+    try:
+        program_type = detect_program_type(repo_path)
+        if not program_type:
+            for subdir in repo_path.iterdir():
+                if subdir.is_dir() and not subdir.name.startswith("."):
+                    program_type = detect_program_type(subdir)
+                    if program_type:
+                        repo_path = subdir
+                        break
+
+        if not program_type:
+            return None
+
+        info = extract_package_info(repo_path, program_type)
+        return repo_path, program_type, info, generate_start_command(repo_path, program_type, info)
+    except Exception:
+        return None
+
 
+def iter_repository_folder(folder_path: str, existing_ports: set[int]) -> Iterator[ImportBundle]:
+    """
+    Lazy form of scan_repository_folder: yields each bundle as soon as its
+    repository has been inspected.
+    """
     try:
         folder = Path(folder_path)
 
         if not folder.exists():
-            return bundles
+            return
 
         if not folder.is_dir():
-            return bundles
+            return
 
         zip_files_to_process = []
         dirs_to_scan = []
@@ -138,8 +178,7 @@ def scan_repository_folder(folder_path: str, existing_ports: set[int]) -> list[I
                 if item.is_file() and item.suffix.lower() == ".zip":
                     zip_files_to_process.append(item)
                 elif item.is_dir():
-                    skip_folders = {"node_modules", ".git", "__pycache__", "venv", ".venv", "dist", "build"}
-                    if item.name not in skip_folders:
+                    if item.name not in SKIP_FOLDERS:
                         dirs_to_scan.append(item)
             except Exception:
                 continue
@@ -163,65 +202,61 @@ def scan_repository_folder(folder_path: str, existing_ports: set[int]) -> list[I
             except Exception:
                 continue
 
-        for repo_path in dirs_to_scan:
-            try:
-                program_type = detect_program_type(repo_path)
-                if not program_type:
-                    for subdir in repo_path.iterdir():
-                        if subdir.is_dir() and not subdir.name.startswith("."):
-                            program_type = detect_program_type(subdir)
-                            if program_type:
-                                repo_path = subdir
-                                break
-
-                if not program_type:
+        if not dirs_to_scan:
+            return
+
+        # Inspect directories concurrently; map() keeps results in directory
+        # order so port assignment below stays sequential and deterministic.
+        with ThreadPoolExecutor(max_workers=min(_SCAN_WORKERS, len(dirs_to_scan))) as executor:
+            for found in executor.map(_inspect_repo, dirs_to_scan):
+                if found is None:
+                    continue
+                repo_path, program_type, info, start_command = found
+
+                try:
+                    port = get_default_port(program_type, existing_ports)
+                    existing_ports.add(port)
+
+                    safe_name = info["name"].replace("@", "").replace("/", "-")[:100]
+
+                    service = ServiceCreate(
+                        name=safe_name,
+                        description=info["description"] or f"Auto-discovered {program_type} program",
+                        category="auto-discovered",
+                        tags=["auto-discovered", program_type],
+                        tech_stack=[program_type],
+                        dependencies=info["dependencies"][:10],
+                        config_paths=[str(repo_path)],
+                        port=port,
+                        local_url=f"http://localhost:{port}",
+                        healthcheck_url=f"http://localhost:{port}/health",
+                        working_directory=str(repo_path),
+                        start_command=start_command,
+                        stop_command="",
+                        restart_command="",
+                        env_overrides={"PORT": str(port)},
+                    )
+
+                    bundle = ImportBundle(
+                        service=service,
+                        requested_port=port,
+                        auto_assign_port=False,
+                        auto_create_db=False,
+                        meta={
+                            "source": "auto_discovery",
+                            "program_type": program_type,
+                            "discovered_at": str(repo_path),
+                        },
+                    )
+
+                except Exception:
                     continue
 
-                info = extract_package_info(repo_path, program_type)
-                port = get_default_port(program_type, existing_ports)
-                existing_ports.add(port)
-
-                safe_name = info["name"].replace("@", "").replace("/", "-")[:100]
-
-                service = ServiceCreate(
-                    name=safe_name,
-                    description=info["description"] or f"Auto-discovered {program_type} program",
-                    category="auto-discovered",
-                    tags=["auto-discovered", program_type],
-                    tech_stack=[program_type],
-                    dependencies=info["dependencies"][:10],
-                    config_paths=[str(repo_path)],
-                    port=port,
-                    local_url=f"http://localhost:{port}",
-                    healthcheck_url=f"http://localhost:{port}/health",
-                    working_directory=str(repo_path),
-                    start_command=generate_start_command(repo_path, program_type, info),
-                    stop_command="",
-                    restart_command="",
-                    env_overrides={"PORT": str(port)},
-                )
-
-                bundle = ImportBundle(
-                    service=service,
-                    requested_port=port,
-                    auto_assign_port=False,
-                    auto_create_db=False,
-                    meta={
-                        "source": "auto_discovery",
-                        "program_type": program_type,
-                        "discovered_at": str(repo_path),
-                    },
-                )
-
-                bundles.append(bundle)
-            except Exception:
-                continue
+                yield bundle
 
     except Exception:
         pass
 
-    return bundles
-
 
 def extract_and_scan_zip(zip_path: Path, extract_to: Path) -> Optional[ImportBundle]:
     """
@@ -0,0 +1,226 @@
+"""
+Keep-alive connection pool for outbound HTTP(S) calls (GitHub API, OAuth).
+
+urllib.request.urlopen() opens, and TLS-handshakes, a new connection for every
+call. urlopen() here accepts the same urllib.request.Request objects and raises
+the same urllib.error.HTTPError for non-2xx responses, but keeps idle
+connections per host so consecutive calls skip the handshake. New connections
+offer the host's last TLS session, so parallel fan-outs that outgrow the idle
+pool get an abbreviated handshake instead of a full one.
+
+Requests that should go through an HTTP(S)_PROXY are handed to urllib, which
+knows how to reach the proxy.
+"""
+from __future__ import annotations
+
+import http.client
+import io
+import select
+import ssl
+import threading
+import urllib.error
+import urllib.parse
+import urllib.request
+from email.message import Message
+
+
+_MAX_IDLE_PER_HOST = 8
+_MAX_REDIRECTS = 5
+_REDIRECT_CODES = frozenset({301, 302, 303, 307, 308})
+
+_ssl_context = ssl.create_default_context()
+
+_lock = threading.Lock()
+_idle: dict[tuple[str, str, int], list[http.client.HTTPConnection]] = {}
+_sessions: dict[tuple[str, str, int], ssl.SSLSession] = {}
+
+
+class PooledResponse:
+    """Fully-read response; mirrors the bits of http.client.HTTPResponse callers use."""
+
+    def __init__(self, url: str, status: int, reason: str, headers: Message, body: bytes):
+        self.url = url
+        self.status = status
+        self.reason = reason
+        self.headers = headers
+        self._body = body
+
+    def read(self) -> bytes:
+        return self._body
+
+    def __enter__(self) -> PooledResponse:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        return None
+
+
+def _pool_key(url: str) -> tuple[str, str, int]:
+    parts = urllib.parse.urlsplit(url)
+    scheme = parts.scheme.lower()
+    if scheme not in {"http", "https"}:
+        raise urllib.error.URLError(f"unsupported URL scheme: {scheme}")
+    port = parts.port or (443 if scheme == "https" else 80)
+    return scheme, parts.hostname or "", port
+
+
+class _ResumingHTTPSConnection(http.client.HTTPSConnection):
+    """HTTPSConnection that offers the pool's cached TLS session when it connects."""
+
+    def __init__(self, key: tuple[str, str, int], timeout: float):
+        super().__init__(key[1], key[2], timeout=timeout, context=_ssl_context)
+        self._pool_key = key
+
+    def connect(self) -> None:
+        http.client.HTTPConnection.connect(self)
+        with _lock:
+            session = _sessions.get(self._pool_key)
+        self.sock = self._context.wrap_socket(self.sock, server_hostname=self.host, session=session)
+
+
+def _connect(key: tuple[str, str, int], timeout: float) -> http.client.HTTPConnection:
+    scheme, host, port = key
+    if scheme == "https":
+        return _ResumingHTTPSConnection(key, timeout)
+    return http.client.HTTPConnection(host, port, timeout=timeout)
+
+
+def _remember_session(key: tuple[str, str, int], conn: http.client.HTTPConnection) -> None:
+    # Read after a full response so TLS 1.3 session tickets have arrived.
+    session = getattr(conn.sock, "session", None)
+    if session is not None:
+        with _lock:
+            _sessions[key] = session
+
+
+def _is_dropped(conn: http.client.HTTPConnection) -> bool:
+    # An idle keep-alive socket only becomes readable when the server has
+    # closed it (or sent something unsolicited); either way it can't be reused.
+    if conn.sock is None:
+        return True
+    try:
+        return bool(select.select([conn.sock], [], [], 0)[0])
+    except (OSError, ValueError):
+        return True
+
+
+def _checkout(key: tuple[str, str, int], timeout: float) -> tuple[http.client.HTTPConnection, bool]:
+    conn = None
+    while conn is None:
+        with _lock:
+            idle = _idle.get(key)
+            if not idle:
+                break
+            conn = idle.pop()
+        if _is_dropped(conn):
+            conn.close()
+            conn = None
+    if conn is None:
+        return _connect(key, timeout), False
+    conn.timeout = timeout
+    if conn.sock is not None:
+        conn.sock.settimeout(timeout)
+    return conn, True
+
+
+def _checkin(key: tuple[str, str, int], conn: http.client.HTTPConnection) -> None:
+    with _lock:
+        idle = _idle.setdefault(key, [])
+        if len(idle) < _MAX_IDLE_PER_HOST:
+            idle.append(conn)
+            return
+    conn.close()
+
+
+_STALE_CONNECTION_ERRORS = (http.client.RemoteDisconnected, BrokenPipeError, ConnectionResetError)
+
+# Only these are resent after a stale-connection error: the server may already
+# have acted on a POST/PUT/PATCH (created a blob, PR or device code) before the
+# reset arrived.
+_RETRYABLE_METHODS = frozenset({"GET", "HEAD"})
+
+
+def _roundtrip(
+    conn: http.client.HTTPConnection, method: str, target: str, headers: dict[str, str], body: bytes | None
+) -> tuple[http.client.HTTPResponse, bytes]:
+    try:
+        conn.request(method, target, body=body, headers=headers)
+        resp = conn.getresponse()
+        return resp, resp.read()
+    except BaseException:
+        conn.close()
+        raise
+
+
+def _send(
+    method: str, url: str, headers: dict[str, str], body: bytes | None, timeout: float
+) -> tuple[int, str, Message, bytes]:
+    key = _pool_key(url)
+    parts = urllib.parse.urlsplit(url)
+    target = parts.path or "/"
+    if parts.query:
+        target += "?" + parts.query
+
+    conn, reused = _checkout(key, timeout)
+    try:
+        resp, data = _roundtrip(conn, method, target, headers, body)
+    except _STALE_CONNECTION_ERRORS:
+        if not reused or method not in _RETRYABLE_METHODS:
+            raise
+        # The server dropped the idle connection; retry once on a fresh one.
+        conn = _connect(key, timeout)
+        resp, data = _roundtrip(conn, method, target, headers, body)
+
+    _remember_session(key, conn)
+    if resp.will_close:
+        conn.close()
+    else:
+        _checkin(key, conn)
+    return resp.status, resp.reason, resp.headers, data
+
+
+def _uses_proxy(url: str) -> bool:
+    # Read per call, like urllib does, so proxy settings need no restart.
+    parts = urllib.parse.urlsplit(url)
+    if parts.scheme.lower() not in urllib.request.getproxies():
+        return False
+    return not urllib.request.proxy_bypass(parts.hostname or "")
+
+
+def urlopen(req: urllib.request.Request, timeout: float = 20) -> PooledResponse:
+    """
+    Pooled stand-in for urllib.request.urlopen(req, timeout=...).
+
+    Follows redirects like urllib does (303, and 301/302 on POST, become GET) and
+    raises urllib.error.HTTPError for any final status outside 2xx, including 304.
+    """
+
+    if _uses_proxy(req.full_url):
+        with urllib.request.urlopen(req, timeout=timeout) as resp:
+            return PooledResponse(resp.url, resp.status, resp.reason, resp.headers, resp.read())
+
+    method = req.get_method()
+    url = req.full_url
+    body = req.data
+    headers = dict(req.header_items())
+
+    for _ in range(_MAX_REDIRECTS + 1):
+        status, reason, resp_headers, data = _send(method, url, headers, body, timeout)
+
+        location = resp_headers.get("Location")
+        if status in _REDIRECT_CODES and location:
+            new_url = urllib.parse.urljoin(url, location)
+            if urllib.parse.urlsplit(new_url).hostname != urllib.parse.urlsplit(url).hostname:
+                # Never forward credentials to another host.
+                headers = {k: v for k, v in headers.items() if k.lower() != "authorization"}
+            if status == 303 or (status in {301, 302} and method not in {"GET", "HEAD"}):
+                method, body = "GET", None
+                headers = {k: v for k, v in headers.items() if k.lower() not in {"content-type", "content-length"}}
+            url = new_url
+            continue
+
+        if not 200 <= status < 300:
+            raise urllib.error.HTTPError(url, status, reason, resp_headers, io.BytesIO(data))
+        return PooledResponse(url, status, reason, resp_headers, data)
+
+    raise urllib.error.HTTPError(url, status, "Too many redirects", resp_headers, io.BytesIO(data))
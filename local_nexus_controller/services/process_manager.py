@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import os
 import subprocess
+import threading
 from datetime import datetime, timezone
 from pathlib import Path
 
@@ -11,6 +12,11 @@ from sqlmodel import Session
 from local_nexus_controller.models import Service
 from local_nexus_controller.settings import settings
 from local_nexus_controller.services.ports import is_port_in_use, next_available_port
+from local_nexus_controller.services.service_index import invalidate_service_index
+
+
+# Serializes port reassignment so concurrent starts cannot pick the same free port.
+_port_reassign_lock = threading.Lock()
 
 
 def _now_utc() -> datetime:
@@ -61,16 +67,18 @@ def start_service(session: Session, service: Service) -> Service:
 
     # Self-heal: if the reserved port is currently in use, reassign.
     if service.port is not None and is_port_in_use("127.0.0.1", int(service.port)) and service.status != "running":
-        old_port = int(service.port)
-        new_port = next_available_port(session, host="127.0.0.1")
-        service.port = new_port
-        if service.local_url and f":{old_port}" in service.local_url:
-            service.local_url = service.local_url.replace(f":{old_port}", f":{new_port}")
-        if service.healthcheck_url and f":{old_port}" in service.healthcheck_url:
-            service.healthcheck_url = service.healthcheck_url.replace(f":{old_port}", f":{new_port}")
-        session.add(service)
-        session.commit()
-        session.refresh(service)
+        with _port_reassign_lock:
+            old_port = int(service.port)
+            new_port = next_available_port(session, host="127.0.0.1")
+            service.port = new_port
+            if service.local_url and f":{old_port}" in service.local_url:
+                service.local_url = service.local_url.replace(f":{old_port}", f":{new_port}")
+            if service.healthcheck_url and f":{old_port}" in service.healthcheck_url:
+                service.healthcheck_url = service.healthcheck_url.replace(f":{old_port}", f":{new_port}")
+            session.add(service)
+            session.commit()
+            session.refresh(service)
+            invalidate_service_index()
 
     log_path = _service_log_path(service)
     log_path.parent.mkdir(parents=True, exist_ok=True)
@@ -245,6 +253,7 @@ def restart_service(session: Session, service: Service) -> Service:
             session.add(service)
             session.commit()
             session.refresh(service)
+            invalidate_service_index()
             return service
         except Exception:
             # Fallback below.
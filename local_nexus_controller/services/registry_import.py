@@ -13,6 +13,7 @@ from local_nexus_controller.models import (
     Service,
 )
 from local_nexus_controller.services.ports import is_port_in_use, next_available_port
+from local_nexus_controller.services.service_index import invalidate_service_index
 
 
 def _now_utc() -> datetime:
@@ -26,53 +27,67 @@ class ImportResult:
     warnings: list[str]
 
 
-def _upsert_database(session: Session, db_in: DatabaseCreate) -> Database:
+def _save(session: Session, obj: object, commit: bool) -> None:
+    # Batch callers pass commit=False: the row is flushed (so ids and later
+    # queries in this session see it) and they commit once at the end.
+    session.add(obj)
+    if commit:
+        session.commit()
+        session.refresh(obj)
+    else:
+        session.flush()
+
+
+def _upsert_database(session: Session, db_in: DatabaseCreate, commit: bool = True) -> Database:
     existing = session.exec(select(Database).where(Database.database_name == db_in.database_name)).first()
     if existing:
         for k, v in db_in.model_dump(exclude_unset=True).items():  # type: ignore[attr-defined]
             setattr(existing, k, v)
         existing.updated_at = _now_utc()
-        session.add(existing)
-        session.commit()
-        session.refresh(existing)
+        _save(session, existing, commit)
         return existing
 
     db = Database(**db_in.model_dump())  # type: ignore[attr-defined]
     db.created_at = _now_utc()
     db.updated_at = _now_utc()
-    session.add(db)
-    session.commit()
-    session.refresh(db)
+    _save(session, db, commit)
     return db
 
 
-def _upsert_service(session: Session, svc_in: dict) -> Service:
+def _upsert_service(session: Session, svc_in: dict, commit: bool = True) -> Service:
     existing = session.exec(select(Service).where(Service.name == svc_in["name"])).first()
     if existing:
         for k, v in svc_in.items():
             setattr(existing, k, v)
         existing.updated_at = _now_utc()
-        session.add(existing)
-        session.commit()
-        session.refresh(existing)
+        _save(session, existing, commit)
         return existing
 
     svc = Service(**svc_in)
     svc.created_at = _now_utc()
     svc.updated_at = _now_utc()
-    session.add(svc)
-    session.commit()
-    session.refresh(svc)
+    _save(session, svc, commit)
     return svc
 
 
-def import_bundle(session: Session, bundle: ImportBundle, host_for_port_checks: str = "127.0.0.1") -> ImportResult:
+def import_bundle(
+    session: Session,
+    bundle: ImportBundle,
+    host_for_port_checks: str = "127.0.0.1",
+    commit: bool = True,
+) -> ImportResult:
+    """
+    Upsert the bundle's service, database and keys.
+
+    With commit=False nothing is committed and the service index is not
+    invalidated; the caller does both once for a whole batch of bundles.
+    """
     warnings: list[str] = []
 
     # Database
     database_id: str | None = None
     if bundle.database and bundle.auto_create_db:
-        db = _upsert_database(session, bundle.database)
+        db = _upsert_database(session, bundle.database, commit)
         database_id = db.id
 
     # Port assignment
@@ -100,13 +115,14 @@ def import_bundle(session: Session, bundle: ImportBundle, host_for_port_checks:
         svc_dict["database_id"] = database_id
     svc_dict.setdefault("status", "stopped")
 
-    svc = _upsert_service(session, svc_dict)
+    svc = _upsert_service(session, svc_dict, commit)
 
     # Replace keys for service
     existing_keys = list(session.exec(select(KeyRef).where(KeyRef.service_id == svc.id)))
     for k in existing_keys:
         session.delete(k)
-    session.commit()
+    if commit:
+        session.commit()
 
     for key_in in bundle.keys or []:
         session.add(
@@ -117,6 +133,10 @@ def import_bundle(session: Session, bundle: ImportBundle, host_for_port_checks:
                 description=key_in.description,
             )
         )
+    if not commit:
+        session.flush()
+        return ImportResult(service_id=svc.id, database_id=database_id, warnings=warnings)
     session.commit()
+    invalidate_service_index()
 
     return ImportResult(service_id=svc.id, database_id=database_id, warnings=warnings)
@@ -0,0 +1,67 @@
+"""
+Process-local cache of the ports and names already reserved in the registry.
+
+Auto-discovery needs both sets on every scan, and rebuilding them costs a
+full pass over the service table. Code paths that add, rename, re-port or
+delete services call invalidate_service_index(); a short TTL covers writes
+made by other processes (e.g. tools/import_bundle.py).
+"""
+from __future__ import annotations
+
+import threading
+import time
+
+from sqlmodel import Session, select
+
+from local_nexus_controller.models import Service
+
+
+_TTL_SECONDS = 30.0
+
+_SELECT_PORTS_AND_NAMES = select(Service.port, Service.name)
+
+_lock = threading.Lock()
+_index: dict = {
+    "ports": set(),
+    "names": set(),
+    "version": 0,
+    "loaded_version": -1,
+    "loaded_at": 0.0,
+}
+
+
+def invalidate_service_index() -> None:
+    """Mark the cached port/name sets stale after a registry write."""
+    with _lock:
+        _index["version"] += 1
+
+
+def existing_ports_and_names(session: Session) -> tuple[set[int], set[str]]:
+    """
+    Return (ports, names) for every registered service.
+
+    Callers get fresh copies, so they may add to them (scan_repository_folder
+    does) without touching the cache.
+    """
+
+    with _lock:
+        version = _index["version"]
+        if _index["loaded_version"] == version and time.monotonic() - _index["loaded_at"] < _TTL_SECONDS:
+            return set(_index["ports"]), set(_index["names"])
+
+    ports: set[int] = set()
+    names: set[str] = set()
+    for port, name in session.exec(_SELECT_PORTS_AND_NAMES):
+        if port is not None:
+            ports.add(int(port))
+        names.add(name)
+
+    with _lock:
+        # Only publish if nothing was invalidated while we were reading.
+        if _index["version"] == version:
+            _index["ports"] = ports
+            _index["names"] = names
+            _index["loaded_version"] = version
+            _index["loaded_at"] = time.monotonic()
+
+    return set(ports), set(names)
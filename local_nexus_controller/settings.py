@@ -25,6 +25,7 @@ class Settings:
     port_range_end: int
     log_dir: Path
     reload: bool
+    workers: int
     open_browser: bool
     repositories_folder: Path | None
     auto_discovery_enabled: bool
@@ -59,6 +60,10 @@ def load_settings() -> Settings:
 
     reload = (os.getenv("LOCAL_NEXUS_RELOAD", "") or "").lower() in {"1", "true", "yes", "on"}
 
+    # Extra uvicorn worker processes (ignored when reload is on). Each worker runs the
+    # startup hooks, so keep this at 1 when auto-start/auto-discovery/file watcher are enabled.
+    workers = max(1, _to_int(os.getenv("LOCAL_NEXUS_WORKERS"), 1))
+
     # Local convenience: auto-open dashboard in browser when launched via `python -m local_nexus_controller`.
     # Defaults to enabled for local runs and disabled for hosted platforms that provide PORT.
     open_browser_default = not bool(platform_port)
@@ -89,6 +94,7 @@ def load_settings() -> Settings:
         port_range_end=port_range_end,
         log_dir=log_dir,
         reload=reload,
+        workers=workers,
         open_browser=open_browser,
         repositories_folder=repositories_folder,
         auto_discovery_enabled=auto_discovery_enabled,